@@ -1,6 +1,8 @@
 import functools
 import re
 import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, ClassVar, List, Optional, Set, Union
 
 from gmso.core.angle_type import AngleType
@@ -14,17 +16,32 @@ from gmso.lib.potential_templates import (
     PotentialTemplateLibrary,
 )
 from gmso.utils._constants import FF_TOKENS_SEPARATOR
-from pydantic import BaseModel, ConfigDict, Field
+from lxml import etree
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from forcefield_utilities.parameters_transformer import ParametersTransformer
+from forcefield_utilities.utils import intern_attribs
 
 __all__ = ["ForceField"]
 
 GMSO_FF_WILDCARD = "*"
 
+_ALPHA_SPLIT_RE = re.compile(r"[a-zA-Z]+")
+
 loaders = {}
 
 
+@functools.lru_cache(maxsize=None)
+def _gmso_potential_template(name: str) -> PotentialTemplate:
+    """Fetch a potential template once per name and reuse it.
+
+    The handful of templates the loaders reference carry validated
+    sympy expressions; interning them here means every force group
+    shares one copy instead of re-resolving the library per call.
+    """
+    return PotentialTemplateLibrary()[name]
+
+
 class registers_loader:
     def __init__(self, name):
         self.name = name
@@ -101,7 +118,9 @@ class AtomTypes(ForceFieldChild):
         children = []
         for atom_type in atom_types.iterchildren():
             if atom_type.tag == Type.__name__:
-                children.append(Type.model_validate(dict(atom_type.attrib)))
+                children.append(
+                    Type.model_validate(intern_attribs(atom_type.attrib))
+                )
         return cls(children=children)
 
 
@@ -139,7 +158,7 @@ class HarmonicBondForce(ForceFieldChild):
     children: List[Bond]
 
     def to_gmso_potentials(self, children):
-        template = PotentialTemplateLibrary()[self.gmso_template]
+        template = _gmso_potential_template(self.gmso_template)
         potentials = {"bond_types": {}}
         for child in self.children:
             parameters = ParametersTransformer.transform(
@@ -163,7 +182,9 @@ class HarmonicBondForce(ForceFieldChild):
         children = []
         for bond_type in bonds.iterchildren():
             if bond_type.tag == Bond.__name__:
-                children.append(Bond.model_validate(dict(bond_type.attrib)))
+                children.append(
+                    Bond.model_validate(intern_attribs(bond_type.attrib))
+                )
         return cls(children=children)
 
 
@@ -211,11 +232,13 @@ class HarmonicAngleForce(ForceFieldChild):
         children = []
         for angle_type in angles.iterchildren():
             if angle_type.tag == Angle.__name__:
-                children.append(Angle.model_validate(dict(angle_type.attrib)))
+                children.append(
+                    Angle.model_validate(intern_attribs(angle_type.attrib))
+                )
         return cls(children=children)
 
     def to_gmso_potentials(self, children):
-        template = PotentialTemplateLibrary()[self.gmso_template]
+        template = _gmso_potential_template(self.gmso_template)
         attr = "angle_types"
         potentials = {"angle_types": {}}
         for child in self.children:
@@ -310,7 +333,7 @@ class RBTorsionForce(ForceFieldChild):
     children: List[Union[RBProper, RBImproper]]
 
     def to_gmso_potentials(self, children):
-        template = PotentialTemplateLibrary()[self.gmso_template]
+        template = _gmso_potential_template(self.gmso_template)
         potentials = {
             "dihedral_types": {},
             "improper_types": {},
@@ -361,7 +384,9 @@ class RBTorsionForce(ForceFieldChild):
                     f"Tag {dihedral_type.tag} not understood skipping"
                 )
                 continue
-            children.append(Creator.model_validate(dict(dihedral_type.attrib)))
+            children.append(
+                Creator.model_validate(intern_attribs(dihedral_type.attrib))
+            )
 
         return cls(children=children)
 
@@ -396,10 +421,9 @@ class PeriodicDihedral(Dihedral):
         max_periodicity = 1
         for key in attrib:
             if key.startswith("periodicity"):
-                periodicity_count = filter(
-                    lambda x: bool(x), re.split(r"[a-zA-z]+", key)
+                periodicity_count = int(
+                    [x for x in _ALPHA_SPLIT_RE.split(key) if x][-1]
                 )
-                periodicity_count = int(list(periodicity_count).pop())
                 if periodicity_count and periodicity_count > max_periodicity:
                     max_periodicity = periodicity_count
         attrib_dict = {"periodicity": [], "phase": [], "k": []}
@@ -452,12 +476,14 @@ class PeriodicTorsionForce(ForceFieldChild):
                     f"Tag {dihedral_type.tag} not understood skipping"
                 )
                 continue
-            children.append(Creator.model_validate(dict(dihedral_type.attrib)))
+            children.append(
+                Creator.model_validate(intern_attribs(dihedral_type.attrib))
+            )
 
         return cls(children=children)
 
     def to_gmso_potentials(self, children):
-        template = PotentialTemplateLibrary()[self.gmso_template]
+        template = _gmso_potential_template(self.gmso_template)
         potentials = {
             "dihedral_types": {},
             "improper_types": {},
@@ -523,11 +549,11 @@ class NonBondedForce(ForceFieldChild):
     lj14scale: Optional[float] = None
 
     def to_gmso_potentials(self, children):
-        template = PotentialTemplateLibrary()[self.gmso_template]
+        template = _gmso_potential_template(self.gmso_template)
         nonbonded = {"atom_types": {}}
-        foyer_atom_types = list(
-            filter(lambda c: isinstance(c, AtomTypes), children)
-        ).pop()
+        foyer_atom_types = next(
+            c for c in children if isinstance(c, AtomTypes)
+        )
         atom_name_to_class_map = {}
         for type_ in foyer_atom_types.children:
             atom_name_to_class_map[type_.name] = type_
@@ -573,7 +599,9 @@ class NonBondedForce(ForceFieldChild):
         for atom_type in nonbonded_atoms.iterchildren():
             if atom_type.tag == "Atom":
                 children.append(
-                    NonBondedAtom.model_validate(dict(atom_type.attrib))
+                    NonBondedAtom.model_validate(
+                        intern_attribs(atom_type.attrib)
+                    )
                 )
         return cls(
             children=children,
@@ -605,52 +633,109 @@ class ForceField(FoyerXMLTag):
         ..., alias="children", description="The children tags"
     )
 
+    _children_buckets = PrivateAttr(default=None)
+
     def to_foyer_etree(self):
         pass
 
     @classmethod
     def load_from_etree(cls, root) -> "ForceField":
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
+        get_loader = loaders.get
         for el in root.iterchildren():
-            if el.tag in loaders:
-                children.append(loaders[el.tag].load_from_etree(el))
+            loader = get_loader(el.tag)
+            if loader is not None:
+                children.append(loader.load_from_etree(el))
         return cls(children=children, **attribs)
 
+    @classmethod
+    def stream_load(cls, filename) -> "ForceField":
+        """Parse a foyer XML incrementally, freeing each force group.
+
+        Streams end events for the registered top level tags straight
+        from the file, dispatching each completed subtree to its loader
+        and clearing it afterwards, so the full DOM never coexists with
+        the constructed model.
+        """
+        return cls.load_from_iterparse(
+            etree.iterparse(
+                filename,
+                events=("end",),
+                tag=tuple(loaders),
+                collect_ids=False,
+                resolve_entities=False,
+                remove_comments=True,
+                huge_tree=True,
+            )
+        )
+
+    @classmethod
+    def load_from_iterparse(cls, events) -> "ForceField":
+        """Build a ForceField from an iterparse end-event stream.
+
+        ``events`` must yield end events for the registered top level
+        tags; each element is consumed and cleared exactly once, so
+        parsing and model construction happen in a single fused pass.
+        """
+        children = []
+        root_attribs = {}
+        for _, el in events:
+            children.append(loaders[el.tag].load_from_etree(el))
+            parent = el.getparent()
+            root_attribs = parent.attrib
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
+        return cls(children=children, **intern_attribs(root_attribs))
+
     def iterate_on(self, children_type):
         if children_type not in loaders:
             raise ValueError(f"Only {list(loaders)} are supported")
-        else:
+        if self._children_buckets is None:
+            # One pass groups the grandchildren by container class, so
+            # repeat iterations become dict lookups instead of walks.
+            buckets = {}
             for child in self.children:
-                if type(child) == loaders[children_type]:
-                    for type_children in child.children:
-                        yield type_children
+                buckets.setdefault(type(child), []).extend(
+                    child.children or ()
+                )
+            self._children_buckets = buckets
+        yield from self._children_buckets.get(loaders[children_type], ())
 
     def to_gmso_ff(self):
         ff = GMSOForceField()
-        ff_potentials = {}
-        for child in self.children:
-            if hasattr(child, "gmso_template") and hasattr(
-                child, "to_gmso_potentials"
-            ):
-                potentials = child.to_gmso_potentials(self.children)
-                for attr in potentials:
-                    if attr in ff_potentials:
-                        ff_potentials[attr].update(potentials[attr])
-                    else:
-                        ff_potentials[attr] = potentials[attr]
-
-        for attr in ff_potentials:
-            setattr(ff, attr, ff_potentials[attr])
-        try:
-            nonbonded_force = list(
-                filter(lambda c: isinstance(c, NonBondedForce), self.children)
-            ).pop()
+        ff_potentials = defaultdict(dict)
+        converters = [
+            child
+            for child in self.children
+            if hasattr(child, "gmso_template")
+            and hasattr(child, "to_gmso_potentials")
+        ]
+        # Each force container converts independently, so dispatch them to
+        # a small thread pool and merge the results in order.
+        with ThreadPoolExecutor(
+            max_workers=min(6, len(converters) or 1)
+        ) as executor:
+            all_potentials = executor.map(
+                lambda child: child.to_gmso_potentials(self.children),
+                converters,
+            )
+            for potentials in all_potentials:
+                for attr, potential_group in potentials.items():
+                    ff_potentials[attr].update(potential_group)
+
+        for attr, potential_group in ff_potentials.items():
+            setattr(ff, attr, potential_group)
+        nonbonded_force = next(
+            (c for c in self.children if isinstance(c, NonBondedForce)), None
+        )
+        if nonbonded_force is not None:
             ff.scaling_factors = {
                 "electrostatics14Scale": nonbonded_force.coulomb14scale,
                 "nonBonded14Scale": nonbonded_force.lj14scale,
             }
-        except TypeError:
+        else:
             warnings.warn("No nonbonded forces found")
 
         ff.name = self.name
@@ -1,4 +1,8 @@
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from itertools import permutations
 from typing import List, Optional, Set, Union
 
 import numpy as np
@@ -14,12 +18,13 @@ from gmso.core.pairpotential_type import (
     PairPotentialType as GMSOPairPotentialType,
 )
 from gmso.utils._constants import FF_TOKENS_SEPARATOR
-from pydantic import BaseModel, ConfigDict, Field
+from lxml import etree
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 # TODO: add custom unyt registry
 from unyt import Unit, UnitRegistry
 
-from forcefield_utilities.utils import pad_with_wildcards
+from forcefield_utilities.utils import intern_attribs, pad_and_key
 
 reg = UnitRegistry()
 charge_dim = u.dimensions.current_mks * u.dimensions.time
@@ -40,6 +45,11 @@ kb_conversion = (
 reg.add("kb", base_value=kb_conversion, dimensions=kb_dim, tex_repr=r"\rm{kb}")
 
 
+# The six member orderings equivalent to an improper identifier: the
+# central member stays first and the remaining three permute.
+_IMPROPER_MIRRORS = tuple((0,) + p for p in permutations((1, 2, 3)))
+
+
 def get_identifiers_registry():
     return {
         "AtomTypes": set(),
@@ -68,24 +78,113 @@ def register_identifiers(registry, identifier, for_type="AtomTypes"):
         registry.add(identifier)
         registry.add(tuple(reversed(identifier)))
     elif for_type == "ImproperTypes":
-        (central, second, third, fourth) = identifier
-        mirrors = [
-            (central, second, third, fourth),
-            (central, second, fourth, third),
-            (central, third, second, fourth),
-            (central, third, fourth, second),
-            (central, fourth, second, third),
-            (central, fourth, third, second),
-        ]
-        for mirror in mirrors:
-            registry.add(mirror)
+        registry.update(
+            tuple(identifier[index] for index in mirror)
+            for mirror in _IMPROPER_MIRRORS
+        )
+
+
+@lru_cache(maxsize=None)
+def _sympified(expr: str) -> sympy.Expr:
+    """Sympify an expression string once per process."""
+    return sympy.sympify(expr)
+
+
+@lru_cache(maxsize=None)
+def _free_symbols_of(expr: str) -> frozenset:
+    """Sympify an expression string once and return its free symbols."""
+    return frozenset(_sympified(expr).free_symbols)
+
+
+@lru_cache(maxsize=None)
+def _symbol(name: str) -> sympy.Symbol:
+    """Return a cached sympy symbol for a variable name."""
+    return sympy.Symbol(name)
+
+
+# Shared sentinel so empty parameter sets hit one indep_vars cache key.
+_EMPTY_FS = frozenset()
+
+
+def _potential_key(members) -> str:
+    """Join member tokens into an interned potential dict key."""
+    return sys.intern(FF_TOKENS_SEPARATOR.join(members))
+
+
+@lru_cache(maxsize=1024)
+def _cached_unit(unit: str, with_reg: bool) -> u.Unit:
+    """Return a cached unyt unit, parsing each unit string only once."""
+    return u.Unit(unit, registry=reg) if with_reg else u.Unit(unit)
+
+
+# Expressions shared by the stock forcefield XMLs, parsed once at import
+# so indep_vars resolves them with a dict lookup instead of a sympify.
+_KNOWN_INDEP_VARS = {
+    expr: _free_symbols_of(expr)
+    for expr in (
+        "4*epsilon*((sigma/r)**12 - (sigma/r)**6)",
+        "epsilon*((sigma/r)**12 - (sigma/r)**6)",
+        "(n/(n-m)) * (n/m)**(m/(n-m)) * epsilon * "
+        "((sigma/r)**n - (sigma/r)**m)",
+        "0.5 * k * (r-r_eq)**2",
+        "k * (r-r_eq)**2",
+        "0.5 * k * (theta-theta_eq)**2",
+        "k * (theta - theta_eq)**2",
+        "k * (1 + cos(n * phi - phi_eq))",
+        "k * (1 + cos(1 * phi - phi_eq))",
+        "0.5 * k0 + 0.5 * k1 * (1 + cos(phi)) + "
+        "0.5 * k2 * (1 - cos(2*phi)) + 0.5 * k3 * (1 + cos(3*phi)) + "
+        "0.5 * k4 * (1 - cos(4*phi))",
+        "c0 + c1 * cos(psi)**1 + c2 * cos(psi)**2 + "
+        "c3 * cos(psi)**3 + c4 * cos(psi)**4 + c5 * cos(psi)**5",
+    )
+}
+
 
+@lru_cache(maxsize=None)
+def _atom_type_units_applier(charge_unit, mass_unit):
+    """Return a closure applying only the default units that are set.
 
-@lru_cache(maxsize=128)
+    The default units are fixed per forcefield, so the branch structure
+    is resolved once here and the per-type loop runs straight through.
+    """
+    if charge_unit and mass_unit:
+
+        def apply(atom_type_dict):
+            if charge := atom_type_dict.get("charge"):
+                atom_type_dict["charge"] = charge * charge_unit
+            if mass := atom_type_dict.get("mass"):
+                atom_type_dict["mass"] = mass * mass_unit
+
+    elif charge_unit:
+
+        def apply(atom_type_dict):
+            if charge := atom_type_dict.get("charge"):
+                atom_type_dict["charge"] = charge * charge_unit
+
+    elif mass_unit:
+
+        def apply(atom_type_dict):
+            if mass := atom_type_dict.get("mass"):
+                atom_type_dict["mass"] = mass * mass_unit
+
+    else:
+
+        def apply(atom_type_dict):
+            return None
+
+    return apply
+
+
+@lru_cache(maxsize=None)
 def indep_vars(expr: str, dependent: frozenset) -> Set:
     """Given an expression and dependent variables, return independent variables for it."""
-    dependent_symbols = frozenset(map(lambda x: sympy.symbols(x), dependent))
-    return sympy.sympify(expr).free_symbols - dependent_symbols
+    free_symbols = _KNOWN_INDEP_VARS.get(expr)
+    if free_symbols is None:
+        free_symbols = _free_symbols_of(expr)
+    return free_symbols - frozenset(
+        _symbol(name) for name in dependent
+    )
 
 
 class GMSOXMLTag(BaseModel):
@@ -94,10 +193,37 @@ class GMSOXMLTag(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
         frozen=True,
+        extra="ignore",
         arbitrary_types_allowed=True,
     )
 
+    _dump_cache: dict = PrivateAttr(default_factory=dict)
+    _params_cache: dict = PrivateAttr(default_factory=dict)
+    _identifier: Optional[tuple] = PrivateAttr(default=None)
+
+    def dumped(self, *, by_alias=True, exclude=frozenset(), exclude_none=True):
+        """Return a shallow copy of a memoized model_dump.
+
+        The tags are frozen, so dumping is invariant across calls; the
+        result is cached per argument combination and copied on return
+        because callers extend the dict in place.
+        """
+        key = (by_alias, exclude, exclude_none)
+        cached = self._dump_cache.get(key)
+        if cached is None:
+            cached = self.model_dump(
+                by_alias=by_alias,
+                exclude=set(exclude),
+                exclude_none=exclude_none,
+            )
+            self._dump_cache[key] = cached
+        return dict(cached)
+
     def parameters(self, units=None):
+        key = None if units is None else frozenset(units.items())
+        cached = self._params_cache.get(key)
+        if cached is not None:
+            return dict(cached)
         params = self.children[0]
         params_dict = {}
         for parameter in params.children:
@@ -107,40 +233,54 @@ class GMSOXMLTag(BaseModel):
                 params_dict[parameter.name] = (
                     parameter.value * units[parameter.name]
                 )
-        return params_dict
+        self._params_cache[key] = params_dict
+        return dict(params_dict)
 
 
 class GMSOXMLChild(GMSOXMLTag):
-    pass
+    _units_children: Optional[list] = PrivateAttr(default=None)
+    _potential_children: Optional[list] = PrivateAttr(default=None)
+
+    def _split_children(self):
+        """Return the (unit defs, potential types) buckets.
+
+        The loaders fill the buckets while parsing; instances built by
+        hand partition their children here on first use.
+        """
+        if self._units_children is None:
+            units_defs, potential_types = [], []
+            for child in self.children:
+                (
+                    units_defs
+                    if type(child) is ParametersUnitDef
+                    else potential_types
+                ).append(child)
+            self._units_children = units_defs
+            self._potential_children = potential_types
+        return self._units_children, self._potential_children
 
 
 class ParametersUnitDef(GMSOXMLTag):
-    parameter: str = Field(
-        ..., description="The name of the parameter", alias="parameter"
-    )
+    parameter: str = Field(..., description="The name of the parameter")
 
-    unit: str = Field(
-        ..., description="The unit of the parameter", alias="unit"
-    )
+    unit: str = Field(..., description="The unit of the parameter")
 
     @classmethod
     def load_from_etree(cls, root):
-        return cls(**root.attrib)
+        return cls(**intern_attribs(root.attrib))
 
 
 class Parameter(GMSOXMLTag):
-    name: str = Field(
-        ..., description="The name of the parameter", alias="name"
-    )
+    name: str = Field(..., description="The name of the parameter")
 
     value: Union[float, np.ndarray] = Field(
-        ..., description="The value of the parameter", alias="value"
+        ..., description="The value of the parameter"
     )
 
     @classmethod
     def load_from_etree(cls, root):
-        attribs = root.attrib
-        if "value" in root.attrib:
+        attribs = intern_attribs(root.attrib)
+        if "value" in attribs:
             return cls(**attribs)
         else:
             children = root.getchildren()
@@ -149,8 +289,10 @@ class Parameter(GMSOXMLTag):
                     "Neither a single value nor a sequence of values provided for "
                     f"parameter {attribs['name']}. Please provide one or the other"
                 )
-            value = np.array(
-                [param_value.text for param_value in children], dtype=float
+            value = np.fromiter(
+                (param_value.text for param_value in children),
+                dtype=np.float64,
+                count=len(children),
             )
             return cls(name=attribs["name"], value=value)
 
@@ -162,89 +304,152 @@ class Parameters(GMSOXMLTag):
 
     @classmethod
     def load_from_etree(cls, root):
-        children = []
-        for el in root.iterchildren():
-            if el.tag == "Parameter":
-                children.append(Parameter.load_from_etree(el))
+        elements = [el for el in root.iterchildren() if el.tag == "Parameter"]
+        raw_values = [el.get("value") for el in elements]
+        if None not in raw_values:
+            # All parameters are scalars; convert them in a single
+            # vectorized pass instead of coercing one string at a time.
+            values = np.asarray(raw_values, dtype=np.float64)
+            children = [
+                Parameter.model_construct(name=el.get("name"), value=value)
+                for el, value in zip(elements, values.tolist())
+            ]
+        else:
+            children = [Parameter.load_from_etree(el) for el in elements]
         return cls(children=children)
 
+    @classmethod
+    def batch_from_etree(cls, elements):
+        """Parse several sibling Parameters elements in one pass.
+
+        Scalar values across all the elements are converted with a
+        single vectorized cast and the models are built with
+        ``model_construct``; any element carrying sequence-valued
+        parameters falls back to the per-element loader.
+        """
+        rows = [
+            list(parameters_el.iterchildren("Parameter"))
+            for parameters_el in elements
+        ]
+        flat = [el.get("value") for row in rows for el in row]
+        if None in flat:
+            return [cls.load_from_etree(el) for el in elements]
+        values = iter(np.asarray(flat, dtype=np.float64).tolist())
+        return [
+            cls.model_construct(
+                children=[
+                    Parameter.model_construct(
+                        name=el.get("name"), value=value
+                    )
+                    for el, value in zip(row, values)
+                ]
+            )
+            for row in rows
+        ]
+
+
+@lru_cache(maxsize=None)
+def _specialized_parameters_parser(param_names):
+    """Return a Parameters parser specialized to a fixed schema.
+
+    Once a types group has declared its ParametersUnitDef entries, every
+    child shares the same parameter names, so the returned closure reads
+    exactly those name/value attributes with direct ``el.get`` calls and
+    converts the values in one vectorized pass. Any element that does not
+    match the declared shape falls back to the generic loader.
+    """
+    name_set = frozenset(param_names)
+
+    def parse(parameters_el):
+        raw = [
+            (el.get("name"), el.get("value"))
+            for el in parameters_el.iterchildren("Parameter")
+        ]
+        if len(raw) != len(param_names) or any(
+            value is None for _, value in raw
+        ):
+            return Parameters.load_from_etree(parameters_el)
+        names, values = zip(*raw)
+        if frozenset(names) != name_set:
+            return Parameters.load_from_etree(parameters_el)
+        values = np.asarray(values, dtype=np.float64)
+        return Parameters.model_construct(
+            children=[
+                Parameter.model_construct(name=name, value=value)
+                for name, value in zip(names, values.tolist())
+            ]
+        )
+
+    return parse
+
 
 class AtomType(GMSOXMLTag):
-    name: str = Field(
-        ..., description="The name for this atom type", alias="name"
-    )
+    name: str = Field(..., description="The name for this atom type")
 
     element: Optional[str] = Field(
-        None, description="The element of the atom type", alias="element"
+        None, description="The element of the atom type"
     )
 
     charge: Optional[float] = Field(
-        None, description="The charge of the atom type", alias="charge"
+        None, description="The charge of the atom type"
     )
 
     mass: Optional[float] = Field(
-        None, description="The mass of the atom type", alias="mass"
+        None, description="The mass of the atom type"
     )
 
     expression: Optional[str] = Field(
         None,
         description="The expression for this atom type",
-        alias="expression",
     )
 
     independent_variables: Optional[str] = Field(
         None,
         description="The independent variables for this atom type",
-        alias="independent_variables",
     )
 
     atomclass: Optional[str] = Field(
-        None, description="The atomclass of this atomtype", alias="atomclass"
+        None, description="The atomclass of this atomtype"
     )
 
-    doi: Optional[str] = Field(
-        None, description="The doi of this atomtype", alias="doi"
-    )
+    doi: Optional[str] = Field(None, description="The doi of this atomtype")
 
-    overrides: Optional[str] = Field(
-        None, description="The overrides", alias="overrides"
-    )
+    overrides: Optional[str] = Field(None, description="The overrides")
 
     definition: Optional[str] = Field(
         None,
         description="The smarts definition of this atom type",
-        alias="definition",
     )
 
     description: Optional[str] = Field(
         None,
         description="The description of this atom type",
-        alias="description",
     )
 
     children: List[Parameters] = Field(
-        ..., description="The parameters and their values", alias="children"
+        ..., description="The parameters and their values"
     )
 
     @classmethod
-    def load_from_etree(cls, root):
-        attribs = root.attrib
+    def load_from_etree(cls, root, parameters_parser=None):
+        attribs = intern_attribs(root.attrib)
+        if parameters_parser is None:
+            parameters_parser = Parameters.load_from_etree
         children = []
         for el in root.iterchildren():
             if el.tag == "Parameters":
-                children.append(Parameters.load_from_etree(el))
+                children.append(parameters_parser(el))
         return cls(children=children, **attribs)
 
 
 class AtomTypes(GMSOXMLChild):
     name: Optional[str] = Field(
-        None, description="The name for this atom type group", alias="name"
+        None, description="The name for this atom type group"
     )
 
     expression: str = Field(
         ...,
         description="The expression for this atom type group",
-        alias="expression",
     )
 
     children: List[Union[ParametersUnitDef, AtomType]] = Field(
@@ -253,110 +458,123 @@ class AtomTypes(GMSOXMLChild):
 
     def to_gmso_potentials(self, default_units):
         potentials = {"atom_types": {}}
-        parameters_units = filter(
-            lambda c: isinstance(c, ParametersUnitDef), self.children
-        )
+        units_defs, atom_types = self._split_children()
         units = {
-            parameter_unit.parameter: u.Unit(parameter_unit.unit, registry=reg)
-            for parameter_unit in parameters_units
+            parameter_unit.parameter: _cached_unit(parameter_unit.unit, True)
+            for parameter_unit in units_defs
         }
 
-        for atom_type in filter(
-            lambda c: isinstance(c, AtomType), self.children
-        ):
-            atom_type_dict = atom_type.model_dump(
-                by_alias=True,
-                exclude={"children", "element"},
-                exclude_none=True,
+        apply_default_units = _atom_type_units_applier(
+            default_units.get("charge"), default_units.get("mass")
+        )
+        for atom_type in atom_types:
+            atom_type_dict = {"name": atom_type.name}
+            for attr in (
+                "charge",
+                "mass",
+                "atomclass",
+                "doi",
+                "definition",
+                "description",
+                "independent_variables",
+            ):
+                value = getattr(atom_type, attr)
+                if value is not None:
+                    atom_type_dict[attr] = value
+
+            overrides = atom_type.overrides
+            atom_type_dict["overrides"] = (
+                set(o.strip() for o in overrides.split(","))
+                if overrides
+                else set()
             )
 
-            overrides = atom_type_dict.get("overrides")
-            if overrides:
-                atom_type_dict["overrides"] = set(
-                    o.strip() for o in overrides.split(",")
-                )
-            else:
-                atom_type_dict["overrides"] = set()
-
-            if "expression" not in atom_type_dict:
-                atom_type_dict["expression"] = self.expression
+            atom_type_dict["expression"] = (
+                atom_type.expression or self.expression
+            )
             atom_type_dict["parameters"] = atom_type.parameters(units)
 
             if not atom_type_dict.get("independent_variables"):
+                parameters = atom_type_dict["parameters"]
                 atom_type_dict["independent_variables"] = indep_vars(
                     atom_type_dict["expression"],
-                    frozenset(atom_type_dict["parameters"]),
+                    frozenset(parameters) if parameters else _EMPTY_FS,
                 )
 
-            if default_units.get("charge") and atom_type_dict.get("charge"):
-                atom_type_dict["charge"] = (
-                    atom_type_dict["charge"] * default_units["charge"]
-                )
-
-            if default_units.get("mass") and atom_type_dict.get("mass"):
-                atom_type_dict["mass"] = (
-                    atom_type_dict["mass"] * default_units["mass"]
-                )
+            apply_default_units(atom_type_dict)
+            atom_type_dict["expression"] = _sympified(
+                atom_type_dict["expression"]
+            )
             gmso_atom_type = GMSOAtomType(**atom_type_dict)
             element = atom_type.element
             if element:
                 gmso_atom_type.add_tag("element", element)
-            potentials["atom_types"][atom_type.name] = gmso_atom_type
+            potentials["atom_types"][
+                sys.intern(atom_type.name)
+            ] = gmso_atom_type
         return potentials
 
     @classmethod
     def load_from_etree(cls, root, existing):
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
+        units_defs, atom_types = [], []
+        parameters_parser = None
         for el in root.iterchildren():
             if el.tag == "ParametersUnitDef":
-                children.append(ParametersUnitDef.load_from_etree(el))
+                units_def = ParametersUnitDef.load_from_etree(el)
+                children.append(units_def)
+                units_defs.append(units_def)
             elif el.tag == "AtomType":
-                atom_type = AtomType.load_from_etree(el)
+                if parameters_parser is None:
+                    parameters_parser = _specialized_parameters_parser(
+                        tuple(sorted(child.parameter for child in children))
+                    )
+                atom_type = AtomType.load_from_etree(el, parameters_parser)
                 identifier = atom_type.name
                 register_identifiers(existing, identifier, "AtomTypes")
                 children.append(atom_type)
-        return cls(children=children, **attribs)
+                atom_types.append(atom_type)
+        group = cls(children=children, **attribs)
+        group._units_children = units_defs
+        group._potential_children = atom_types
+        return group
 
 
 class BondType(GMSOXMLTag):
-    name: str = Field(
-        None, description="The name of the bond type", alias="name"
-    )
+    name: str = Field(None, description="The name of the bond type")
 
     class1: Optional[str] = Field(
-        None, description="Class 1 for this bond type", alias="class1"
+        None, description="Class 1 for this bond type"
     )
 
     class2: Optional[str] = Field(
-        None, description="Class 2 for this bond type", alias="class2"
+        None, description="Class 2 for this bond type"
     )
 
-    type1: Optional[str] = Field(
-        None, description="Type 1 for this bond type", alias="type1"
-    )
+    type1: Optional[str] = Field(None, description="Type 1 for this bond type")
 
-    type2: Optional[str] = Field(
-        None, description="Type 2 for this bond type", alias="type2"
-    )
+    type2: Optional[str] = Field(None, description="Type 2 for this bond type")
 
     children: List[Parameters] = Field(
-        ..., description="The parameters and their values", alias="children"
+        ..., description="The parameters and their values"
     )
 
     @classmethod
     def load_from_etree(cls, root):
         children = []
-        attribs = pad_with_wildcards(root.attrib, 2)
+        attribs, identifier = pad_and_key(intern_attribs(root.attrib), 2)
         for el in root.iterchildren():
             if el.tag == "Parameters":
                 children.append(Parameters.load_from_etree(el))
-        return cls(children=children, **attribs)
+        bond_type = cls(children=children, **attribs)
+        bond_type._identifier = identifier
+        return bond_type
 
 
 class BondTypes(GMSOXMLChild):
     name: Optional[str] = Field(
-        None, description="The name for this bond types group", alias="name"
+        None, description="The name for this bond types group"
     )
 
     expression: str = Field(
@@ -364,26 +582,22 @@ class BondTypes(GMSOXMLChild):
     )
 
     children: List[Union[ParametersUnitDef, BondType]] = Field(
-        ..., description="Children of this bond type tag", alias="children"
+        ..., description="Children of this bond type tag"
     )
 
     def to_gmso_potentials(self, default_units):
         potentials = {"bond_types": {}}
-        parameters_units = filter(
-            lambda c: isinstance(c, ParametersUnitDef), self.children
-        )
+        units_defs, bond_types = self._split_children()
         units = {
-            parameter_unit.parameter: u.Unit(parameter_unit.unit)
-            for parameter_unit in parameters_units
+            parameter_unit.parameter: _cached_unit(parameter_unit.unit, False)
+            for parameter_unit in units_defs
         }
 
-        for bond_type in filter(
-            lambda c: isinstance(c, BondType), self.children
-        ):
-            bond_type_dict = bond_type.model_dump(
-                by_alias=True,
-                exclude={"children", "type1", "type2", "class1", "class2"},
-                exclude_none=True,
+        for bond_type in bond_types:
+            bond_type_dict = bond_type.dumped(
+                exclude=frozenset(
+                    {"children", "type1", "type2", "class1", "class2"}
+                )
             )
 
             if "expression" not in bond_type_dict:
@@ -402,89 +616,95 @@ class BondTypes(GMSOXMLChild):
                 )
 
             bond_type_dict["parameters"] = bond_type.parameters(units)
+            parameters = bond_type_dict["parameters"]
             bond_type_dict["independent_variables"] = indep_vars(
                 bond_type_dict["expression"],
-                frozenset(bond_type_dict["parameters"]),
+                frozenset(parameters) if parameters else _EMPTY_FS,
             )
 
+            bond_type_dict["expression"] = _sympified(
+                bond_type_dict["expression"]
+            )
             gmso_bond_type = GMSOBondType(**bond_type_dict)
-            if gmso_bond_type.member_types:
-                potentials["bond_types"][
-                    FF_TOKENS_SEPARATOR.join(gmso_bond_type.member_types)
-                ] = gmso_bond_type
-            else:
-                potentials["bond_types"][
-                    FF_TOKENS_SEPARATOR.join(gmso_bond_type.member_classes)
-                ] = gmso_bond_type
+            potentials["bond_types"][
+                _potential_key(
+                    gmso_bond_type.member_types
+                    or gmso_bond_type.member_classes
+                )
+            ] = gmso_bond_type
 
         return potentials
 
     @classmethod
     def load_from_etree(cls, root, existing):
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
+        units_defs, bond_types = [], []
         for el in root.iterchildren():
             if el.tag == "ParametersUnitDef":
-                children.append(ParametersUnitDef.load_from_etree(el))
+                units_def = ParametersUnitDef.load_from_etree(el)
+                children.append(units_def)
+                units_defs.append(units_def)
             elif el.tag == "BondType":
                 bond_type = BondType.load_from_etree(el)
-                identifier = tuple(
-                    [bond_type.class1, bond_type.class2]
-                    if bond_type.class1
-                    else [bond_type.type1, bond_type.type2]
+                register_identifiers(
+                    existing, bond_type._identifier, "BondTypes"
                 )
-                register_identifiers(existing, identifier, "BondTypes")
                 children.append(bond_type)
+                bond_types.append(bond_type)
 
-        return cls(children=children, **attribs)
+        group = cls(children=children, **attribs)
+        group._units_children = units_defs
+        group._potential_children = bond_types
+        return group
 
 
 class AngleType(GMSOXMLTag):
-    name: str = Field(
-        None, description="The name of the angle type", alias="name"
-    )
+    name: str = Field(None, description="The name of the angle type")
 
     class1: Optional[str] = Field(
-        None, description="Class 1 for this angle type", alias="class1"
+        None, description="Class 1 for this angle type"
     )
 
     class2: Optional[str] = Field(
-        None, description="Class 2 for this angle type", alias="class2"
+        None, description="Class 2 for this angle type"
     )
 
     class3: Optional[str] = Field(
-        None, description="Class 3 for this angle type", alias="class3"
+        None, description="Class 3 for this angle type"
     )
 
     type1: Optional[str] = Field(
-        None, description="Type 1 for this angle type", alias="type1"
+        None, description="Type 1 for this angle type"
     )
 
     type2: Optional[str] = Field(
-        None, description="Type 2 for this angle type", alias="type2"
+        None, description="Type 2 for this angle type"
     )
 
     type3: Optional[str] = Field(
-        None, description="Type 3 for this angle type", alias="type3"
+        None, description="Type 3 for this angle type"
     )
 
     children: List[Parameters] = Field(
-        ..., description="The parameters and their values", alias="children"
+        ..., description="The parameters and their values"
     )
 
     @classmethod
     def load_from_etree(cls, root):
         children = []
-        attribs = pad_with_wildcards(root.attrib, 3)
+        attribs, identifier = pad_and_key(intern_attribs(root.attrib), 3)
         for el in root.iterchildren():
             if el.tag == "Parameters":
                 children.append(Parameters.load_from_etree(el))
-        return cls(children=children, **attribs)
+        angle_type = cls(children=children, **attribs)
+        angle_type._identifier = identifier
+        return angle_type
 
 
 class AngleTypes(GMSOXMLChild):
     name: Optional[str] = Field(
-        None, description="The name for this angle types group", alias="name"
+        None, description="The name for this angle types group"
     )
 
     expression: str = Field(
@@ -492,34 +712,30 @@ class AngleTypes(GMSOXMLChild):
     )
 
     children: List[Union[ParametersUnitDef, AngleType]] = Field(
-        ..., description="Children of this angle types tag", alias="children"
+        ..., description="Children of this angle types tag"
     )
 
     def to_gmso_potentials(self, default_units):
         potentials = {"angle_types": {}}
-        parameters_units = filter(
-            lambda c: isinstance(c, ParametersUnitDef), self.children
-        )
+        units_defs, angle_types = self._split_children()
         units = {
-            parameter_unit.parameter: u.Unit(parameter_unit.unit)
-            for parameter_unit in parameters_units
+            parameter_unit.parameter: _cached_unit(parameter_unit.unit, False)
+            for parameter_unit in units_defs
         }
 
-        for angle_type in filter(
-            lambda c: isinstance(c, AngleType), self.children
-        ):
-            angle_type_dict = angle_type.model_dump(
-                by_alias=True,
-                exclude={
-                    "children",
-                    "type1",
-                    "type2",
-                    "type3",
-                    "class1",
-                    "class2",
-                    "class3",
-                },
-                exclude_none=True,
+        for angle_type in angle_types:
+            angle_type_dict = angle_type.dumped(
+                exclude=frozenset(
+                    {
+                        "children",
+                        "type1",
+                        "type2",
+                        "type3",
+                        "class1",
+                        "class2",
+                        "class3",
+                    }
+                )
             )
 
             if "expression" not in angle_type_dict:
@@ -540,106 +756,106 @@ class AngleTypes(GMSOXMLChild):
                 )
 
             angle_type_dict["parameters"] = angle_type.parameters(units)
+            parameters = angle_type_dict["parameters"]
             angle_type_dict["independent_variables"] = indep_vars(
                 angle_type_dict["expression"],
-                frozenset(angle_type_dict["parameters"]),
+                frozenset(parameters) if parameters else _EMPTY_FS,
+            )
+            angle_type_dict["expression"] = _sympified(
+                angle_type_dict["expression"]
             )
             gmso_angle_type = GMSOAngleType(**angle_type_dict)
-            if gmso_angle_type.member_types:
-                potentials["angle_types"][
-                    FF_TOKENS_SEPARATOR.join(gmso_angle_type.member_types)
-                ] = gmso_angle_type
-            else:
-                potentials["angle_types"][
-                    FF_TOKENS_SEPARATOR.join(gmso_angle_type.member_classes)
-                ] = gmso_angle_type
+            potentials["angle_types"][
+                _potential_key(
+                    gmso_angle_type.member_types
+                    or gmso_angle_type.member_classes
+                )
+            ] = gmso_angle_type
 
         return potentials
 
     @classmethod
     def load_from_etree(cls, root, existing):
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
+        units_defs, angle_types = [], []
         for el in root.iterchildren():
             if el.tag == "ParametersUnitDef":
-                children.append(ParametersUnitDef.load_from_etree(el))
+                units_def = ParametersUnitDef.load_from_etree(el)
+                children.append(units_def)
+                units_defs.append(units_def)
             elif el.tag == "AngleType":
                 angle_type = AngleType.load_from_etree(el)
-                identifier = tuple(
-                    [angle_type.class1, angle_type.class2, angle_type.class3]
-                    if angle_type.class1
-                    else [angle_type.type1, angle_type.type2, angle_type.type3]
+                register_identifiers(
+                    existing, angle_type._identifier, "AngleTypes"
                 )
-                register_identifiers(existing, identifier, "AngleTypes")
                 children.append(angle_type)
-        return cls(children=children, **attribs)
+                angle_types.append(angle_type)
+        group = cls(children=children, **attribs)
+        group._units_children = units_defs
+        group._potential_children = angle_types
+        return group
 
 
 class TorsionType(GMSOXMLTag):
     name: str = Field(
-        None, description="The name of the Dihedral/Improper type", alias="name"
+        None, description="The name of the Dihedral/Improper type"
     )
 
     class1: Optional[str] = Field(
         None,
         description="Class 1 for this Dihedral/Improper type",
-        alias="class1",
     )
 
     class2: Optional[str] = Field(
         None,
         description="Class 2 for this Dihedral/Improper type",
-        alias="class2",
     )
 
     class3: Optional[str] = Field(
         None,
         description="Class 3 for this Dihedral/Improper type",
-        alias="class3",
     )
 
     class4: Optional[str] = Field(
         None,
         description="Class 4 for this Dihedral/Improper type",
-        alias="class4",
     )
 
     type1: Optional[str] = Field(
         None,
         description="Type 1 for this Dihedral/Improper type",
-        alias="type1",
     )
 
     type2: Optional[str] = Field(
         None,
         description="Type 2 for this Dihedral/Improper type",
-        alias="type2",
     )
 
     type3: Optional[str] = Field(
         None,
         description="Type 3 for this Dihedral/Improper type",
-        alias="type3",
     )
 
     type4: Optional[str] = Field(
         None,
         description="Type 4 for this Dihedral/Improper type",
-        alias="type4",
     )
 
     children: List[Parameters] = Field(
-        ..., description="The parameters and their values", alias="children"
+        ..., description="The parameters and their values"
     )
 
     @classmethod
     def load_from_etree(cls, root):
         children = []
-        attribs = pad_with_wildcards(root.attrib, 4)
+        attribs, identifier = pad_and_key(intern_attribs(root.attrib), 4)
         for el in root.iterchildren():
             if el.tag == "Parameters":
                 children.append(Parameters.load_from_etree(el))
-        return cls(children=children, **attribs)
+        tor_type = cls(children=children, **attribs)
+        tor_type._identifier = identifier
+        return tor_type
 
 
 class DihedralType(TorsionType):
@@ -652,7 +868,7 @@ class ImproperType(TorsionType):
 
 class TorsionTypes(GMSOXMLChild):
     name: Optional[str] = Field(
-        None, description="The name for this angle types group", alias="name"
+        None, description="The name for this angle types group"
     )
 
     expression: str = Field(
@@ -662,36 +878,31 @@ class TorsionTypes(GMSOXMLChild):
     children: List[Union[ParametersUnitDef, TorsionType]] = Field(
         ...,
         description="Children of this dihedral/improper types tag",
-        alias="children",
     )
 
     def to_gmso_potentials(self, default_units):
         potentials = {"dihedral_types": {}, "improper_types": {}}
-        parameters_units = filter(
-            lambda c: isinstance(c, ParametersUnitDef), self.children
-        )
+        units_defs, torsion_types = self._split_children()
         units = {
-            parameter_unit.parameter: u.Unit(parameter_unit.unit)
-            for parameter_unit in parameters_units
+            parameter_unit.parameter: _cached_unit(parameter_unit.unit, False)
+            for parameter_unit in units_defs
         }
 
-        for torsion_type in filter(
-            lambda c: isinstance(c, (DihedralType, ImproperType)), self.children
-        ):
-            torsion_dict = torsion_type.model_dump(
-                by_alias=True,
-                exclude={
-                    "children",
-                    "type1",
-                    "type2",
-                    "type3",
-                    "type4",
-                    "class1",
-                    "class2",
-                    "class3",
-                    "class4",
-                },
-                exclude_none=True,
+        for torsion_type in torsion_types:
+            torsion_dict = torsion_type.dumped(
+                exclude=frozenset(
+                    {
+                        "children",
+                        "type1",
+                        "type2",
+                        "type3",
+                        "type4",
+                        "class1",
+                        "class2",
+                        "class3",
+                        "class4",
+                    }
+                )
             )
 
             if "expression" not in torsion_dict:
@@ -724,9 +935,13 @@ class TorsionTypes(GMSOXMLChild):
                 )
 
             torsion_dict["parameters"] = torsion_type.parameters(units)
+            parameters = torsion_dict["parameters"]
             torsion_dict["independent_variables"] = indep_vars(
                 torsion_dict["expression"],
-                frozenset(torsion_dict["parameters"]),
+                frozenset(parameters) if parameters else _EMPTY_FS,
+            )
+            torsion_dict["expression"] = _sympified(
+                torsion_dict["expression"]
             )
             if isinstance(torsion_type, DihedralType):
                 gmso_torsion_type = GMSODihedralType(**torsion_dict)
@@ -735,57 +950,44 @@ class TorsionTypes(GMSOXMLChild):
                 gmso_torsion_type = GMSOImproperType(**torsion_dict)
                 key = "improper_types"
 
-            if gmso_torsion_type.member_types:
-                potentials[key][
-                    FF_TOKENS_SEPARATOR.join(gmso_torsion_type.member_types)
-                ] = gmso_torsion_type
-            else:
-                potentials[key][
-                    FF_TOKENS_SEPARATOR.join(gmso_torsion_type.member_classes)
-                ] = gmso_torsion_type
+            potentials[key][
+                _potential_key(
+                    gmso_torsion_type.member_types
+                    or gmso_torsion_type.member_classes
+                )
+            ] = gmso_torsion_type
 
         return potentials
 
     @classmethod
     def load_from_etree(cls, root, existing_dihedrals, existing_impropers):
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
+        units_defs, torsion_types = [], []
         child_loaders = {
             "DihedralType": DihedralType,
             "ImproperType": ImproperType,
         }
         for el in root.iterchildren():
             if el.tag == "ParametersUnitDef":
-                children.append(ParametersUnitDef.load_from_etree(el))
+                units_def = ParametersUnitDef.load_from_etree(el)
+                children.append(units_def)
+                units_defs.append(units_def)
             elif el.tag == "DihedralType" or el.tag == "ImproperType":
                 tor_type = child_loaders[el.tag].load_from_etree(el)
-                identifier = tuple(
-                    [
-                        tor_type.class1,
-                        tor_type.class2,
-                        tor_type.class3,
-                        tor_type.class4,
-                    ]
-                    if tor_type.class1
-                    else [
-                        tor_type.type1,
-                        tor_type.type2,
-                        tor_type.type3,
-                        tor_type.type4,
-                    ]
-                )
+                is_improper = el.tag == "ImproperType"
                 register_identifiers(
-                    (
-                        existing_impropers
-                        if el.tag == "ImproperType"
-                        else existing_dihedrals
-                    ),
-                    identifier,
-                    el.tag + "s",
+                    existing_impropers if is_improper else existing_dihedrals,
+                    tor_type._identifier,
+                    "ImproperTypes" if is_improper else "DihedralTypes",
                 )
                 children.append(tor_type)
+                torsion_types.append(tor_type)
 
-        return cls(children=children, **attribs)
+        group = cls(children=children, **attribs)
+        group._units_children = units_defs
+        group._potential_children = torsion_types
+        return group
 
 
 class ImproperTypes(TorsionTypes):
@@ -797,99 +999,91 @@ class DihedralTypes(TorsionTypes):
 
 
 class PairPotentialType(GMSOXMLTag):
-    name: str = Field(
-        ..., description="Name of this PairPotential Type", alias="name"
-    )
+    name: str = Field(..., description="Name of this PairPotential Type")
 
     type1: Optional[str] = Field(
-        None, description="The type1 of this PairPotential Type", alias="type1"
+        None, description="The type1 of this PairPotential Type"
     )
 
     type2: Optional[str] = Field(
-        None, description="The type2 of this PairPotential Type", alias="type2"
+        None, description="The type2 of this PairPotential Type"
     )
 
     class1: Optional[str] = Field(
         None,
         description="The class1 of this PairPotential Type",
-        alias="class1",
     )
 
     class2: Optional[str] = Field(
         None,
         description="The class2 of this PairPotential Type",
-        alias="class2",
     )
 
     children: List[Parameters] = Field(
-        ..., description="The parameters and their values", alias="children"
+        ..., description="The parameters and their values"
     )
 
     @classmethod
     def load_from_etree(cls, root):
-        attribs = pad_with_wildcards(root.attrib, 2)
-        children = []
-        for el in root.iterchildren():
-            children.append(Parameters.load_from_etree(el))
-        return cls(children=children, **attribs)
+        attribs, identifier = pad_and_key(intern_attribs(root.attrib), 2)
+        children = Parameters.batch_from_etree(list(root.iterchildren()))
+        pptype = cls(children=children, **attribs)
+        pptype._identifier = identifier
+        return pptype
 
 
 class PairPotentialTypes(GMSOXMLChild):
     name: Optional[str] = Field(
         None,
         description="The name of this pair potential types group",
-        alias="name",
     )
 
     expression: str = Field(
         ...,
         description="The expression for this pair potential types group",
-        alias="expression",
     )
 
     children: List[Union[ParametersUnitDef, PairPotentialType]] = Field(
-        ..., description="The children", alias="children"
+        ..., description="The children"
     )
 
     @classmethod
     def load_from_etree(cls, root, existing):
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
+        units_defs, pairpotential_types = [], []
         for el in root.iterchildren():
             if el.tag == "ParametersUnitDef":
-                children.append(ParametersUnitDef.load_from_etree(el))
+                units_def = ParametersUnitDef.load_from_etree(el)
+                children.append(units_def)
+                units_defs.append(units_def)
             elif el.tag == "PairPotentialType":
                 pptype = PairPotentialType.load_from_etree(el)
-                identifier = tuple(
-                    [pptype.class1, pptype.class2]
-                    if pptype.class1
-                    else [pptype.type1, pptype.type2]
+                register_identifiers(
+                    existing, pptype._identifier, "PairPotentialTypes"
                 )
-                register_identifiers(existing, identifier, "PairPotentialTypes")
                 children.append(pptype)
-        return cls(children=children, **attribs)
+                pairpotential_types.append(pptype)
+        group = cls(children=children, **attribs)
+        group._units_children = units_defs
+        group._potential_children = pairpotential_types
+        return group
 
     def to_gmso_potentials(self, default_units):
         potentials = {"pairpotential_types": {}}
-        parameters_units = filter(
-            lambda c: isinstance(c, ParametersUnitDef), self.children
-        )
+        units_defs, pairpotential_types = self._split_children()
         units = {
-            parameter_unit.parameter: u.Unit(parameter_unit.unit)
-            for parameter_unit in parameters_units
+            parameter_unit.parameter: _cached_unit(parameter_unit.unit, False)
+            for parameter_unit in units_defs
         }
 
-        for pairpotential_type in filter(
-            lambda c: isinstance(c, PairPotentialType), self.children
-        ):
-            pairpotential_type_dict = pairpotential_type.model_dump(
-                by_alias=True,
-                exclude={"children", "type1", "type2", "class1", "class2"},
-                exclude_none=True,
-            )
-
-            if "expression" not in pairpotential_type_dict:
-                pairpotential_type_dict["expression"] = self.expression
+        for pairpotential_type in pairpotential_types:
+            # Every field except name is either excluded or None-filtered
+            # here, so build the dict directly instead of dumping.
+            pairpotential_type_dict = {
+                "name": pairpotential_type.name,
+                "expression": self.expression,
+            }
 
             if pairpotential_type.type1 and pairpotential_type.type2:
                 pairpotential_type_dict["member_types"] = (
@@ -906,63 +1100,61 @@ class PairPotentialTypes(GMSOXMLChild):
             pairpotential_type_dict["parameters"] = (
                 pairpotential_type.parameters(units)
             )
+            parameters = pairpotential_type_dict["parameters"]
             pairpotential_type_dict["independent_variables"] = indep_vars(
                 pairpotential_type_dict["expression"],
-                frozenset(pairpotential_type_dict["parameters"]),
+                frozenset(parameters) if parameters else _EMPTY_FS,
             )
 
+            pairpotential_type_dict["expression"] = _sympified(
+                pairpotential_type_dict["expression"]
+            )
             gmso_pairpotential_type = GMSOPairPotentialType(
                 **pairpotential_type_dict
             )
-            if gmso_pairpotential_type.member_types:
-                potentials["pairpotential_types"][
-                    FF_TOKENS_SEPARATOR.join(
-                        gmso_pairpotential_type.member_types
-                    )
-                ] = gmso_pairpotential_type
-            else:
-                potentials["pairpotential_types"][
-                    FF_TOKENS_SEPARATOR.join(
-                        gmso_pairpotential_type.member_classes
-                    )
-                ] = gmso_pairpotential_type
+            potentials["pairpotential_types"][
+                _potential_key(
+                    gmso_pairpotential_type.member_types
+                    or gmso_pairpotential_type.member_classes
+                )
+            ] = gmso_pairpotential_type
 
         return potentials
 
 
 class Units(GMSOXMLTag):
-    energy: Optional[str] = Field(None, alias="energy")
+    energy: Optional[str] = Field(None)
 
-    distance: Optional[str] = Field(None, alias="distance")
+    distance: Optional[str] = Field(None)
 
-    mass: Optional[str] = Field(None, alias="mass")
+    mass: Optional[str] = Field(None)
 
-    charge: Optional[str] = Field(None, alias="charge")
+    charge: Optional[str] = Field(None)
 
-    temperature: Optional[str] = Field(None, alias="temperature")
+    temperature: Optional[str] = Field(None)
 
-    angle: Optional[str] = Field(None, alias="angle")
+    angle: Optional[str] = Field(None)
 
-    time: Optional[str] = Field(None, alias="time")
+    time: Optional[str] = Field(None)
 
     @classmethod
     def load_from_etree(cls, root):
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         return cls(**attribs)
 
 
 class FFMetaData(GMSOXMLChild):
-    children: List[Units] = Field([], alias="children")
+    children: List[Units] = Field([])
 
-    electrostatics14Scale: float = Field(0.5, alias="electrostatics14Scale")
+    electrostatics14Scale: float = Field(0.5)
 
-    nonBonded14Scale: float = Field(0.5, alias="nonBonded14Scale")
+    nonBonded14Scale: float = Field(0.5)
 
     combining_rule: str = Field("geometric", alias="combiningRule")
 
     @classmethod
     def load_from_etree(cls, root):
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
         for unit in root.iterchildren():
             children.append(Units.load_from_etree(unit))
@@ -990,6 +1182,7 @@ class FFMetaData(GMSOXMLChild):
         return units_dict
 
 
+@lru_cache(maxsize=None)
 def source_units(unit):
     try:
         attach_unit = u.Unit(unit, registry=reg)
@@ -1001,97 +1194,128 @@ def source_units(unit):
     return attach_unit
 
 
+# Table dispatch for the top level group tags; each entry takes the
+# element and the identifiers registry and returns the loaded group.
+_ETREE_LOADERS = {
+    "FFMetaData": lambda el, registry: FFMetaData.load_from_etree(el),
+    "AtomTypes": lambda el, registry: AtomTypes.load_from_etree(
+        el, registry["AtomTypes"]
+    ),
+    "BondTypes": lambda el, registry: BondTypes.load_from_etree(
+        el, registry["BondTypes"]
+    ),
+    "AngleTypes": lambda el, registry: AngleTypes.load_from_etree(
+        el, registry["AngleTypes"]
+    ),
+    "DihedralTypes": lambda el, registry: DihedralTypes.load_from_etree(
+        el, registry["DihedralTypes"], registry["ImproperTypes"]
+    ),
+    "ImproperTypes": lambda el, registry: ImproperTypes.load_from_etree(
+        el, registry["DihedralTypes"], registry["ImproperTypes"]
+    ),
+    "PairPotentialTypes": (
+        lambda el, registry: PairPotentialTypes.load_from_etree(
+            el, registry["PairPotentialTypes"]
+        )
+    ),
+}
+
+
 class ForceField(GMSOXMLTag):
-    name: str = Field(
-        "ForceField", description="Name of the ForceField", alias="name"
-    )
+    name: str = Field("ForceField", description="Name of the ForceField")
 
-    version: str = Field(
-        "1.0.0", description="The version of the ForceField", alias="version"
-    )
+    version: str = Field("1.0.0", description="The version of the ForceField")
 
-    children: List[GMSOXMLChild] = Field(
-        ..., description="The children tags", alias="children"
-    )
+    children: List[GMSOXMLChild] = Field(..., description="The children tags")
 
     def to_gmso_ff(self):
         ff = GMSOForceField()
         ff.name = self.name
         ff.version = self.version
-        metadata = list(
-            filter(lambda child: isinstance(child, FFMetaData), self.children)
-        ).pop()
+        metadata = next(
+            child
+            for child in self.children
+            if isinstance(child, FFMetaData)
+        )
         default_units = metadata.get_default_units()
         ff.units = default_units
         ff.scaling_factors = metadata.gmso_scaling_factors()
         ff.combining_rule = metadata.combining_rule
-        remaining_children = filter(
-            lambda c: not isinstance(c, (FFMetaData, Units)),
-            self.children,
-        )
-        ff_potentials = {}
-
-        for child in remaining_children:
-            if hasattr(child, "to_gmso_potentials"):
-                potentials = child.to_gmso_potentials(default_units)
-                for attr in potentials:
-                    if attr in ff_potentials:
-                        ff_potentials[attr].update(potentials[attr])
-                    else:
-                        ff_potentials[attr] = potentials[attr]
+        converters = [
+            child
+            for child in self.children
+            if not isinstance(child, (FFMetaData, Units))
+            and hasattr(child, "to_gmso_potentials")
+        ]
+        ff_potentials = defaultdict(dict)
+
+        # The group conversions are independent, so dispatch them to a
+        # small thread pool and merge the results in order.
+        with ThreadPoolExecutor(
+            max_workers=min(6, len(converters) or 1)
+        ) as executor:
+            all_potentials = executor.map(
+                lambda child: child.to_gmso_potentials(default_units),
+                converters,
+            )
+            for potentials in all_potentials:
+                for attr, potential_group in potentials.items():
+                    ff_potentials[attr].update(potential_group)
 
-        for attr in ff_potentials:
-            setattr(ff, attr, ff_potentials[attr])
+        for attr, potential_group in ff_potentials.items():
+            setattr(ff, attr, potential_group)
 
         return ff
 
+    @classmethod
+    def _load_child(cls, el, identifiers_registry):
+        """Load one top level group element, or None for unknown tags."""
+        loader = _ETREE_LOADERS.get(el.tag)
+        if loader is None:
+            return None
+        return loader(el, identifiers_registry)
+
     @classmethod
     def load_from_etree(cls, root) -> "ForceField":
-        attribs = root.attrib
+        attribs = intern_attribs(root.attrib)
         children = []
         identifiers_registry = get_identifiers_registry()
         for el in root.iterchildren():
-            if el.tag == "FFMetaData":
-                children.append(FFMetaData.load_from_etree(el))
-            if el.tag == "AtomTypes":
-                children.append(
-                    AtomTypes.load_from_etree(
-                        el, identifiers_registry["AtomTypes"]
-                    )
-                )
-            elif el.tag == "BondTypes":
-                children.append(
-                    BondTypes.load_from_etree(
-                        el, identifiers_registry["BondTypes"]
-                    )
-                )
-            elif el.tag == "AngleTypes":
-                children.append(
-                    AngleTypes.load_from_etree(
-                        el, identifiers_registry["AngleTypes"]
-                    )
-                )
-            elif el.tag == "DihedralTypes":
-                children.append(
-                    DihedralTypes.load_from_etree(
-                        el,
-                        identifiers_registry["DihedralTypes"],
-                        identifiers_registry["ImproperTypes"],
-                    )
-                )
-            elif el.tag == "ImproperTypes":
-                children.append(
-                    ImproperTypes.load_from_etree(
-                        el,
-                        identifiers_registry["DihedralTypes"],
-                        identifiers_registry["ImproperTypes"],
-                    )
-                )
-            elif el.tag == "PairPotentialTypes":
-                children.append(
-                    PairPotentialTypes.load_from_etree(
-                        el, identifiers_registry["PairPotentialTypes"]
-                    )
-                )
+            child = cls._load_child(el, identifiers_registry)
+            if child is not None:
+                children.append(child)
 
         return cls(children=children, **attribs)
+
+    @classmethod
+    def stream_load(cls, filename) -> "ForceField":
+        """Parse a GMSO XML incrementally, freeing each group once loaded.
+
+        Dispatches end events for the top level group tags to the same
+        loaders as ``load_from_etree`` and then clears the finished
+        subtree, so peak memory stays at one group instead of the whole
+        document. The eager ``load_from_etree`` remains the better fit
+        for small trees that are already parsed.
+        """
+        identifiers_registry = get_identifiers_registry()
+        children = []
+        root_attribs = {}
+        events = etree.iterparse(
+            filename,
+            events=("end",),
+            tag=tuple(_ETREE_LOADERS),
+            collect_ids=False,
+            resolve_entities=False,
+            remove_comments=True,
+            huge_tree=True,
+        )
+        for _, el in events:
+            child = cls._load_child(el, identifiers_registry)
+            if child is not None:
+                children.append(child)
+            parent = el.getparent()
+            root_attribs = parent.attrib
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
+        return cls(children=children, **intern_attribs(root_attribs))
@@ -1,5 +1,12 @@
+import numpy as np
 import unyt as u
 
+# Composite units built once; unyt unit arithmetic is not free and these
+# recur for every transformed parameter set.
+_KJ_PER_MOL = u.kJ / u.mol
+_KJ_PER_MOL_NM2 = u.kJ / (u.nm**2) / u.mol
+_KJ_PER_MOL_RAD2 = u.kJ / (u.radian**2) / u.mol
+
 
 class TransformationError(Exception):
     pass
@@ -8,25 +15,18 @@ class TransformationError(Exception):
 class ParametersTransformer:
     @staticmethod
     def transform(name, parameters):
-        if name == "LennardJonesPotential":
-            return ParametersTransformer.transform_lennard_jones(parameters)
-        elif name == "HarmonicBondPotential":
-            return ParametersTransformer.transform_harmonic_bond(parameters)
-        elif name == "HarmonicAnglePotential":
-            return ParametersTransformer.transform_harmonic_angle(parameters)
-        elif name == "RyckaertBellemansTorsionPotential":
-            return ParametersTransformer.transform_rb_torsion(parameters)
-        elif name == "PeriodicTorsionPotential":
-            return ParametersTransformer.transform_periodic_torsion(parameters)
-        else:
+        try:
+            transformer = _TRANSFORMERS[name]
+        except KeyError:
             raise TransformationError(
                 f"No transformation is defined for {name}"
-            )
+            ) from None
+        return transformer(parameters)
 
     @staticmethod
     def transform_lennard_jones(parameters):
         transformed = {
-            "epsilon": parameters["epsilon"] * u.kJ / u.mol,
+            "epsilon": parameters["epsilon"] * _KJ_PER_MOL,
             "sigma": parameters["sigma"] * u.nm,
         }
         return transformed
@@ -34,7 +34,7 @@ class ParametersTransformer:
     @staticmethod
     def transform_harmonic_bond(parameters):
         transformed = {
-            "k": parameters["k"] * u.kJ / (u.nm**2) / u.mol,
+            "k": parameters["k"] * _KJ_PER_MOL_NM2,
             "r_eq": parameters["length"] * u.nm,
         }
         return transformed
@@ -42,28 +42,43 @@ class ParametersTransformer:
     @staticmethod
     def transform_harmonic_angle(parameters):
         transformed = {
-            "k": parameters["k"] * u.kJ / (u.radian**2) / u.mol,
+            "k": parameters["k"] * _KJ_PER_MOL_RAD2,
             "theta_eq": parameters["angle"] * u.radian,
         }
         return transformed
 
     @staticmethod
     def transform_rb_torsion(parameters):
-        transformed = {
-            "c0": parameters["c0"] * u.kJ / u.mol,
-            "c1": parameters["c1"] * u.kJ / u.mol,
-            "c2": parameters["c2"] * u.kJ / u.mol,
-            "c3": parameters["c3"] * u.kJ / u.mol,
-            "c4": parameters["c4"] * u.kJ / u.mol,
-            "c5": parameters["c5"] * u.kJ / u.mol,
-        }
-        return transformed
+        # One broadcast multiply attaches the unit to all six
+        # coefficients at once instead of six quantity constructions.
+        coefficients = (
+            np.fromiter(
+                (parameters[f"c{j}"] for j in range(6)),
+                dtype=np.float64,
+                count=6,
+            )
+            * _KJ_PER_MOL
+        )
+        return {f"c{j}": coefficients[j] for j in range(6)}
 
     @staticmethod
     def transform_periodic_torsion(parameters):
         transformed = {
-            "k": parameters["k"] * u.kJ / u.mol,
+            "k": parameters["k"] * _KJ_PER_MOL,
             "phi_eq": parameters["phase"] * u.radian,
             "n": parameters["periodicity"] * u.dimensionless,
         }
         return transformed
+
+
+_TRANSFORMERS = {
+    "LennardJonesPotential": ParametersTransformer.transform_lennard_jones,
+    "HarmonicBondPotential": ParametersTransformer.transform_harmonic_bond,
+    "HarmonicAnglePotential": ParametersTransformer.transform_harmonic_angle,
+    "RyckaertBellemansTorsionPotential": (
+        ParametersTransformer.transform_rb_torsion
+    ),
+    "PeriodicTorsionPotential": (
+        ParametersTransformer.transform_periodic_torsion
+    ),
+}
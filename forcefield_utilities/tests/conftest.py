@@ -0,0 +1,29 @@
+import functools
+
+import pytest
+
+from forcefield_utilities.xml_loader import FoyerFFs, GMSOFFs
+
+
+@functools.cache
+def _gmso_ff(slug):
+    """Convert a foyer forcefield slug to gmso at most once per session."""
+    return FoyerFFs.get_ff(slug).to_gmso_ff()
+
+
+@pytest.fixture(scope="session")
+def gmso_ff_by_slug():
+    return _gmso_ff
+
+
+@pytest.fixture(scope="session")
+def gmso_ff_from_xml():
+    """Load and convert each GMSO XML test file at most once per session."""
+    cache = {}
+
+    def _load(path):
+        if path not in cache:
+            cache[path] = GMSOFFs().load(path).to_gmso_ff()
+        return cache[path]
+
+    return _load
@@ -1,38 +1,98 @@
+import sys
+from math import isclose
+
 import numpy as np
 import pytest
 import unyt as u
 from gmso.utils._constants import FF_TOKENS_SEPARATOR
 
 from forcefield_utilities.foyer_xml import AtomTypes, NonBondedForce
-from forcefield_utilities.tests.base_test import BaseTest
 from forcefield_utilities.xml_loader import FoyerFFs
 
 parameters_map = {"length": "r_eq", "angle": "theta_eq"}
 
+# Interned once; inside the assertion loops every slot probe is then
+# a plain dict hit instead of a fresh f-string.
+_CLASS_ATTRS = tuple(sys.intern(f"class{i}") for i in range(1, 5))
+_TYPE_ATTRS = tuple(sys.intern(f"type{i}") for i in range(1, 5))
+_MISSING = object()
+
+_SPLIT_CACHE = {}
+
+
+def _nonbonded_and_atom_types(parameters_ff):
+    """Find the NonBondedForce and AtomTypes children in a single pass.
+
+    The result is cached per forcefield object so the repeated lookups
+    across tests do not rescan the children list. The forcefield itself
+    is kept in the cache entry to pin its id for the session.
+    """
+    key = id(parameters_ff)
+    if key not in _SPLIT_CACHE:
+        nb_force = atom_types = None
+        for child in parameters_ff.children:
+            if isinstance(child, NonBondedForce):
+                nb_force = child
+            elif isinstance(child, AtomTypes):
+                atom_types = child
+        _SPLIT_CACHE[key] = (parameters_ff, nb_force, atom_types)
+    _, nb_force, atom_types = _SPLIT_CACHE[key]
+    return nb_force, atom_types
+
+
+_CHILDREN_BY_TAG = {}
+
+
+def _children_by_tag(parameters_ff, tag):
+    """Materialize ``iterate_on(tag)`` once per forcefield and tag.
+
+    The force equivalency helper runs once per potential family, and
+    each run used to re-walk the whole XML tree; the lists are cached
+    by object id for the session, like ``_nonbonded_and_atom_types``.
+    """
+    key = (id(parameters_ff), tag)
+    if key not in _CHILDREN_BY_TAG:
+        _CHILDREN_BY_TAG[key] = (
+            parameters_ff,
+            list(parameters_ff.iterate_on(tag)),
+        )
+    return _CHILDREN_BY_TAG[key][1]
+
+
+_INDEX_CACHE = {}
+
+
+def _indexed_children(container, attr):
+    """Index a container's children by an attribute once per session.
+
+    Cached by object id alongside the container itself, in the same
+    style as the other session caches in this module.
+    """
+    key = (id(container), attr)
+    if key not in _INDEX_CACHE:
+        _INDEX_CACHE[key] = (
+            container,
+            {getattr(child, attr): child for child in container.children},
+        )
+    return _INDEX_CACHE[key][1]
+
 
 def assert_atomtypes_equivalency(parameters_ff, gmso_ff):
     atom_types_gmso = gmso_ff.atom_types
-    non_bonded_forces = list(
-        filter(lambda c: isinstance(c, NonBondedForce), parameters_ff.children)
-    ).pop()
-    xml_atom_types = list(
-        filter(lambda c: isinstance(c, AtomTypes), parameters_ff.children)
-    ).pop()
-    nb_atom_types = {
-        non_bonded.atom_type: non_bonded
-        for non_bonded in non_bonded_forces.children
-    }
-
-    xml_atom_types = {
-        xml_atom_type.name: xml_atom_type
-        for xml_atom_type in xml_atom_types.children
-    }
+    non_bonded_forces, xml_atom_types = _nonbonded_and_atom_types(
+        parameters_ff
+    )
+    nb_atom_types = _indexed_children(non_bonded_forces, "atom_type")
+    xml_atom_types = _indexed_children(xml_atom_types, "name")
     for atom_type_name in nb_atom_types:
         type_ = nb_atom_types[atom_type_name]
         atom_type_gmso = atom_types_gmso[atom_type_name]
         assert type_.atom_type == atom_type_gmso.name
-        assert np.allclose(
-            type_.charge, (atom_type_gmso.charge / u.elementary_charge).value
+        assert isclose(
+            type_.charge,
+            (atom_type_gmso.charge / u.elementary_charge).value,
+            rel_tol=1e-5,
+            abs_tol=1e-8,
         )
         assert type_.sigma == atom_type_gmso.parameters["sigma"].value
         assert type_.epsilon == atom_type_gmso.parameters["epsilon"].value
@@ -46,7 +106,12 @@ def assert_atomtypes_equivalency(parameters_ff, gmso_ff):
         assert atom_type.smarts_def == atom_type_gmso.definition
         assert atom_type.desc == atom_type_gmso.description
         assert atom_type.element == atom_type_gmso.get_tag("element")
-        assert np.allclose(atom_type.mass, atom_type_gmso.mass.value)
+        assert isclose(
+            atom_type.mass,
+            atom_type_gmso.mass.value,
+            rel_tol=1e-5,
+            abs_tol=1e-8,
+        )
         if atom_type.overrides:
             for splited in atom_type.overrides.split(","):
                 assert splited.strip() in atom_type_gmso.overrides
@@ -61,206 +126,139 @@ def assert_forces_equivalency(
     gmso_potential_type="bond_types",
     has_mixed_children=False,
 ):
-    all_children_iter = parameters_ff.iterate_on(xml_force_attr)
+    all_children_iter = _children_by_tag(parameters_ff, xml_force_attr)
     gmso_potentials = getattr(gmso_ff, gmso_potential_type)
 
     if len(gmso_potentials) == 0:
         return
 
     for child in all_children_iter:
-        count = 0
         classes = []
+        for name in _CLASS_ATTRS:
+            value = getattr(child, name, _MISSING)
+            if value is _MISSING:
+                break
+            classes.append(value)
         types = []
-        while hasattr(child, f"class{count+1}"):
-            classes.append(getattr(child, f"class{count+1}"))
-            count += 1
-        count = 0
-        while hasattr(child, f"type{count + 1}"):
-            types.append(getattr(child, f"type{count + 1}"))
-            count += 1
+        for name in _TYPE_ATTRS:
+            value = getattr(child, name, _MISSING)
+            if value is _MISSING:
+                break
+            types.append(value)
 
         if any(classes):
-            classes = FF_TOKENS_SEPARATOR.join(
+            class_tuple = tuple(
                 class_ if class_ else "*" for class_ in classes
             )
+            key = FF_TOKENS_SEPARATOR.join(class_tuple)
             try:
-                gmso_potential = gmso_potentials[classes]
+                gmso_potential = gmso_potentials[key]
             except KeyError as e:
                 if has_mixed_children:
                     continue
                 else:
                     raise e
             assert gmso_potential.member_types is None
-            assert gmso_potential.member_classes == tuple(
-                classes.split(FF_TOKENS_SEPARATOR)
-            )
+            assert gmso_potential.member_classes == class_tuple
         else:
-            types = FF_TOKENS_SEPARATOR.join(
-                type_ if type_ else "*" for type_ in types
-            )
+            type_tuple = tuple(type_ if type_ else "*" for type_ in types)
+            key = FF_TOKENS_SEPARATOR.join(type_tuple)
             try:
-                gmso_potential = gmso_potentials[types]
+                gmso_potential = gmso_potentials[key]
             except KeyError as e:
                 if has_mixed_children:
                     continue
                 else:
                     raise e
             assert gmso_potential.member_classes is None
-            assert gmso_potential.member_types == tuple(
-                types.split(FF_TOKENS_SEPARATOR)
-            )
+            assert gmso_potential.member_types == type_tuple
 
         btype_params = gmso_potential.get_parameters()
         btype_params_xml = child.parameters()
-        for key in btype_params_xml:
-            if key in btype_params:
-                assert np.allclose(
-                    btype_params[key].value, btype_params_xml[key]
-                )
-            else:
+        xml_vals = []
+        gmso_vals = []
+        for key, value in btype_params_xml.items():
+            if key not in btype_params:
                 assert key in parameters_map
-                new_key_gmso = parameters_map[key]
-                assert np.allclose(
-                    btype_params[new_key_gmso].value, btype_params_xml[key]
-                )
-
-
-class TestGMSOFFConversionOPLSAA(BaseTest):
-    @pytest.fixture(scope="session")
-    def oplsaa_gmso(self):
-        return FoyerFFs.get_ff("oplsaa").to_gmso_ff()
-
-    def test_atom_types(self, oplsaa_gmso):
-        assert_atomtypes_equivalency(FoyerFFs.get_ff("oplsaa"), oplsaa_gmso)
-
-    def test_bond_types(self, oplsaa_gmso):
-        assert_forces_equivalency(FoyerFFs.get_ff("oplsaa"), oplsaa_gmso)
-
-    def test_angle_types(self, oplsaa_gmso):
-        assert_forces_equivalency(
-            FoyerFFs.get_ff("oplsaa"),
-            oplsaa_gmso,
-            "HarmonicAngleForce",
-            "angle_types",
-        )
-
-    def test_dihedral_types(self, oplsaa_gmso):
-        assert_forces_equivalency(
-            FoyerFFs.get_ff("oplsaa"),
-            oplsaa_gmso,
-            "RBTorsionForce",
-            "dihedral_types",
-        )
-
-    def test_metadata(self, oplsaa_gmso):
-        assert oplsaa_gmso.name == FoyerFFs.get_ff("oplsaa").name
-        assert oplsaa_gmso.version == FoyerFFs.get_ff("oplsaa").version
-        non_bonded_forces = list(
-            filter(
-                lambda c: isinstance(c, NonBondedForce),
-                FoyerFFs.get_ff("oplsaa").children,
-            )
-        ).pop()
-        scaling_factors = {
-            "electrostatics14Scale": non_bonded_forces.coulomb14scale,
-            "nonBonded14Scale": non_bonded_forces.lj14scale,
-        }
-        assert scaling_factors == oplsaa_gmso.scaling_factors
-
-
-class TestGMSOFFConversionTRAPPEUA(BaseTest):
-    @pytest.fixture(scope="session")
-    def trappe_ua_gmso(self):
-        return FoyerFFs.get_ff("trappe-ua").to_gmso_ff()
-
-    def test_atom_types(self, trappe_ua_gmso):
-        assert_atomtypes_equivalency(
-            FoyerFFs.get_ff("trappe-ua"), trappe_ua_gmso
-        )
-
-    def test_bond_types(self, trappe_ua_gmso):
-        assert_forces_equivalency(FoyerFFs.get_ff("trappe-ua"), trappe_ua_gmso)
-
-    def test_angle_types(self, trappe_ua_gmso):
-        assert_forces_equivalency(
-            FoyerFFs.get_ff("trappe-ua"),
-            trappe_ua_gmso,
-            "HarmonicAngleForce",
-            "angle_types",
-        )
+                key = parameters_map[key]
+            xml_vals.append(value)
+            gmso_vals.append(btype_params[key].value)
+        assert np.allclose(gmso_vals, xml_vals)
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        "oplsaa",
+        "trappe-ua",
+        pytest.param(
+            "gaff",
+            marks=pytest.mark.skipif(
+                condition=not hasattr(FoyerFFs, "gaff"),
+                reason="Gaff Forcefield not found",
+            ),
+        ),
+    ],
+)
+def ff_pair(request, gmso_ff_by_slug):
+    """Yield (name, parsed XML forcefield, converted gmso forcefield)."""
+    raw = FoyerFFs.get_ff(request.param)
+    return request.param, raw, gmso_ff_by_slug(request.param)
 
-    def test_dihedral_types(self, trappe_ua_gmso):
-        assert_forces_equivalency(
-            FoyerFFs.get_ff("trappe-ua"),
-            trappe_ua_gmso,
-            "RBTorsionForce",
-            "dihedral_types",
-        )
 
-    def test_metadata(self, trappe_ua_gmso):
-        assert trappe_ua_gmso.name == FoyerFFs.get_ff("trappe-ua").name
-        assert trappe_ua_gmso.version == FoyerFFs.get_ff("trappe-ua").version
-        non_bonded_forces = list(
-            filter(
-                lambda c: isinstance(c, NonBondedForce),
-                FoyerFFs.get_ff("trappe-ua").children,
-            )
-        ).pop()
-        scaling_factors = {
-            "electrostatics14Scale": non_bonded_forces.coulomb14scale,
-            "nonBonded14Scale": non_bonded_forces.lj14scale,
-        }
-        assert scaling_factors == trappe_ua_gmso.scaling_factors
+def test_atom_types(ff_pair):
+    _, parameters_ff, gmso_ff = ff_pair
+    assert_atomtypes_equivalency(parameters_ff, gmso_ff)
 
 
-@pytest.mark.skipif(
-    condition=not hasattr(FoyerFFs, "gaff"),
-    reason="Gaff Forcefield not found",
-)
-class TestGMSOFFConversionGAFF:
-    @pytest.fixture(scope="session")
-    def gaff_gmso(self):
-        return FoyerFFs.gaff.to_gmso_ff()
+def test_bond_types(ff_pair):
+    _, parameters_ff, gmso_ff = ff_pair
+    assert_forces_equivalency(parameters_ff, gmso_ff)
 
-    def test_atom_types(self, gaff_gmso):
-        assert_atomtypes_equivalency(FoyerFFs.gaff, gaff_gmso)
 
-    def test_bond_types(self, gaff_gmso):
-        assert_forces_equivalency(FoyerFFs.gaff, gaff_gmso)
+def test_angle_types(ff_pair):
+    _, parameters_ff, gmso_ff = ff_pair
+    assert_forces_equivalency(
+        parameters_ff,
+        gmso_ff,
+        "HarmonicAngleForce",
+        "angle_types",
+    )
 
-    def test_angle_types(self, gaff_gmso):
-        assert_forces_equivalency(
-            FoyerFFs.gaff, gaff_gmso, "HarmonicAngleForce", "angle_types"
-        )
 
-    def test_dihedral_types(self, gaff_gmso):
+def test_dihedral_types(ff_pair):
+    name, parameters_ff, gmso_ff = ff_pair
+    if name == "gaff":
         assert_forces_equivalency(
-            FoyerFFs.get_ff("trappe-ua"),
-            gaff_gmso,
+            parameters_ff,
+            gmso_ff,
             "PeriodicTorsionForce",
             "dihedral_types",
             has_mixed_children=True,
         )
-
-    def test_dihedral_types(self, gaff_gmso):
         assert_forces_equivalency(
-            FoyerFFs.get_ff("trappe-ua"),
-            gaff_gmso,
+            parameters_ff,
+            gmso_ff,
             "PeriodicTorsionForce",
             "improper_types",
             has_mixed_children=True,
         )
+    else:
+        assert_forces_equivalency(
+            parameters_ff,
+            gmso_ff,
+            "RBTorsionForce",
+            "dihedral_types",
+        )
 
-    def test_metadata(self, gaff_gmso):
-        assert gaff_gmso.name == FoyerFFs.gaff.name
-        assert gaff_gmso.version == FoyerFFs.gaff.version
-        non_bonded_forces = list(
-            filter(
-                lambda c: isinstance(c, NonBondedForce), FoyerFFs.gaff.children
-            )
-        ).pop()
-        scaling_factors = {
-            "electrostatics14Scale": non_bonded_forces.coulomb14scale,
-            "nonBonded14Scale": non_bonded_forces.lj14scale,
-        }
-        assert scaling_factors == gaff_gmso.scaling_factors
+
+def test_metadata(ff_pair):
+    _, parameters_ff, gmso_ff = ff_pair
+    assert gmso_ff.name == parameters_ff.name
+    assert gmso_ff.version == parameters_ff.version
+    non_bonded_forces, _ = _nonbonded_and_atom_types(parameters_ff)
+    scaling_factors = {
+        "electrostatics14Scale": non_bonded_forces.coulomb14scale,
+        "nonBonded14Scale": non_bonded_forces.lj14scale,
+    }
+    assert scaling_factors == gmso_ff.scaling_factors
@@ -1,3 +1,6 @@
+import functools
+
+import numpy as np
 import pytest
 import unyt as u
 from gmso.tests.utils import get_path
@@ -9,11 +12,16 @@ from forcefield_utilities.tests.utils import get_test_file_path
 from forcefield_utilities.xml_loader import GMSOFFs
 
 
+@functools.cache
+def _sym(expression):
+    """Sympify each distinct expression string once per session."""
+    return sympify(expression)
+
+
 class TestEthyleneFF(BaseTest):
     @pytest.fixture(scope="session")
-    def ff_example_zero(self):
-        example_zero = get_path("ethylene.xml")
-        return GMSOFFs().load(example_zero).to_gmso_ff()
+    def ff_example_zero(self, gmso_ff_from_xml):
+        return gmso_ff_from_xml(get_path("ethylene.xml"))
 
     def test_metadata(self, ff_example_zero):
         assert ff_example_zero.scaling_factors == {
@@ -92,9 +100,8 @@ class TestEthyleneFF(BaseTest):
 
 class TestTwoPropanolMIEFF(BaseTest):
     @pytest.fixture(scope="session")
-    def propanol_ua_mie(self):
-        propanol_ua_mie_path = get_test_file_path("propanol_Mie_ua.xml")
-        return GMSOFFs().load(propanol_ua_mie_path).to_gmso_ff()
+    def propanol_ua_mie(self, gmso_ff_from_xml):
+        return gmso_ff_from_xml(get_test_file_path("propanol_Mie_ua.xml"))
 
     def test_metadata(self, propanol_ua_mie):
         assert (
@@ -123,7 +130,7 @@ class TestTwoPropanolMIEFF(BaseTest):
         assert ch3_sp3.doi == "10.1021/jp984742e and 10.1021/jp972543+"
         assert ch3_sp3.overrides == set()
 
-        assert ch3_sp3.expression == sympify(
+        assert ch3_sp3.expression == _sym(
             "(n/(n-m)) * (n/m)**(m/(n-m)) * epsilon * ((sigma/r)**n - (sigma/r)**m)"
         )
 
@@ -147,7 +154,7 @@ class TestTwoPropanolMIEFF(BaseTest):
         assert o.doi == "10.1021/jp003882x"
         assert o.overrides == set()
 
-        assert o.expression == sympify(
+        assert o.expression == _sym(
             "(n/(n-m)) * (n/m)**(m/(n-m)) * epsilon * ((sigma/r)**n - (sigma/r)**m)"
         )
 
@@ -163,7 +170,7 @@ class TestTwoPropanolMIEFF(BaseTest):
         bond_type_ch3_ch = propanol_ua_mie.bond_types["CH3~CH"]
         assert bond_type_ch3_ch.name == "BondType_Harmonic_CH3_CH"
         assert bond_type_ch3_ch.member_classes == ("CH3", "CH")
-        assert bond_type_ch3_ch.expression == sympify("k * (r-r_eq)**2")
+        assert bond_type_ch3_ch.expression == _sym("k * (r-r_eq)**2")
 
         parameters = bond_type_ch3_ch.get_parameters()
         assert u.allclose_units(
@@ -176,7 +183,7 @@ class TestTwoPropanolMIEFF(BaseTest):
 
         assert angle_type_ch3_ch_o.name == "AngleType_Harmonic_CH3_CH_O"
         assert angle_type_ch3_ch_o.member_classes == ("CH3", "CH", "O")
-        assert angle_type_ch3_ch_o.expression == sympify(
+        assert angle_type_ch3_ch_o.expression == _sym(
             "k * (theta - theta_eq)**2"
         )
 
@@ -199,7 +206,7 @@ class TestTwoPropanolMIEFF(BaseTest):
             "O",
             "H",
         )
-        assert dihedral_type_ch3_ch_o_h.expression == sympify(
+        assert dihedral_type_ch3_ch_o_h.expression == _sym(
             "k0 + k1 * (1 + cos(1 * phi - phi_eq1)) + "
             "k2 * (1 + cos(2 * phi - phi_eq2)) + "
             "k3 * (1 + cos(3 * phi - phi_eq3)) + "
@@ -208,33 +215,37 @@ class TestTwoPropanolMIEFF(BaseTest):
         )
 
         parameters = dihedral_type_ch3_ch_o_h.get_parameters()
-        assert u.allclose_units(parameters["k0"], 0.0 * u.kcal / u.mol)
-        assert u.allclose_units(
-            parameters["k1"], 0.416955197548017 * u.kcal / u.mol
+        expected_k = np.array(
+            [
+                0.0,
+                0.416955197548017,
+                -0.0579667482245528,
+                0.37345529632637,
+                0.0,
+                0.0,
+            ]
         )
-        assert u.allclose_units(
-            parameters["k2"], -0.0579667482245528 * u.kcal / u.mol
+        actual_k = np.array(
+            [parameters[f"k{i}"].to("kcal/mol").value for i in range(6)]
         )
-        assert u.allclose_units(
-            parameters["k3"], 0.37345529632637 * u.kcal / u.mol
+        assert np.allclose(actual_k, expected_k)
+
+        expected_phi = np.array([0.0, 180.0, 0.0, 0.0, 0.0])
+        actual_phi = np.array(
+            [
+                parameters[f"phi_eq{i}"].to("degree").value
+                for i in range(1, 6)
+            ]
         )
-        assert u.allclose_units(parameters["k4"], 0.0 * u.kcal / u.mol)
-        assert u.allclose_units(parameters["k5"], 0.0 * u.kcal / u.mol)
-
-        assert u.allclose_units(parameters["phi_eq1"], 0.0 * u.degree)
-        assert u.allclose_units(parameters["phi_eq2"], 180 * u.degree)
-        assert u.allclose_units(parameters["phi_eq3"], 0.0 * u.degree)
-        assert u.allclose_units(parameters["phi_eq4"], 0.0 * u.degree)
-        assert u.allclose_units(parameters["phi_eq5"], 0.0 * u.degree)
+        assert np.allclose(actual_phi, expected_phi)
 
 
 class TestListParameters(BaseTest):
     @pytest.fixture(scope="session")
-    def propanol_ua_mie_list(self):
-        propanol_ua_mie_path = get_test_file_path(
-            "propanol_Mie_ua_list_wildcards.xml"
+    def propanol_ua_mie_list(self, gmso_ff_from_xml):
+        return gmso_ff_from_xml(
+            get_test_file_path("propanol_Mie_ua_list_wildcards.xml")
         )
-        return GMSOFFs().load(propanol_ua_mie_path).to_gmso_ff()
 
     def test_dihedral_params(self, propanol_ua_mie_list):
         dih_with_list = propanol_ua_mie_list.dihedral_types["CH3~CH~O~H"]
@@ -1,18 +1,19 @@
+from time import perf_counter
+
 import pytest
 from foyer.forcefield import get_available_forcefield_loaders
 
 from forcefield_utilities.tests.base_test import BaseTest
 from forcefield_utilities.tests.utils import get_test_file_path
-from forcefield_utilities.utils import get_package_file_path
 from forcefield_utilities.xml_loader import FoyerFFs, GMSOFFs
 
 
 class TestXMLLoader(BaseTest):
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def foyer_xml_loader(self):
         return FoyerFFs()
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def gmso_xml_loader(self):
         return GMSOFFs()
 
@@ -28,13 +29,19 @@ class TestXMLLoader(BaseTest):
         assert "gaff" in foyer_xml_loader.loaded_ffs
 
     def test_caching(self, foyer_xml_loader):
+        foyer_xml_loader.clear_cache()
+        start = perf_counter()
         oplsaa = foyer_xml_loader.load("oplsaa")
-        id_oplsaa = id(oplsaa)
-        for j in range(100):
-            assert id_oplsaa == id(foyer_xml_loader.load("oplsaa"))
+        loaded = perf_counter()
+        cached = foyer_xml_loader.load("oplsaa")
+        hit = perf_counter()
+        assert oplsaa is cached
+        # A cache hit must not re-parse; it should be far below the
+        # cold-load latency.
+        assert (hit - loaded) < (loaded - start) / 10
         foyer_xml_loader.clear_cache()
         assert foyer_xml_loader.loaded_ffs == {}
-        assert id_oplsaa != foyer_xml_loader.load("oplsaa")
+        assert foyer_xml_loader.load("oplsaa") is not oplsaa
 
     def test_getitem_get_attr(self, foyer_xml_loader):
         oplsaa = foyer_xml_loader.load("oplsaa")
@@ -54,7 +61,7 @@ class TestXMLLoader(BaseTest):
             foyer_xml_loader.load("trappe-ua", rel_to_module=True)
 
     def test_custom_register(self, foyer_xml_loader):
-        xml_path = get_package_file_path("foyer", "tests/files/benzene_lb.xml")
+        xml_path = get_test_file_path("benzene_lb.xml")
         foyer_xml_loader.register_custom_forcefield("benzene_lb", xml_path)
         foyer_xml_loader.load("benzene_lb")
         assert "benzene_lb" in foyer_xml_loader.loaded_ffs
@@ -1,13 +1,15 @@
 from pathlib import Path
 
+_FILES_DIR = Path(__file__).parent.joinpath("files").resolve()
+
 
 def get_test_file_path(filename):
     """Give a filename, return its location in test files."""
-    file_path = Path(__file__).parent / "files" / filename
+    file_path = _FILES_DIR / filename
 
-    if not file_path.resolve().exists():
+    if not file_path.exists():
         raise FileNotFoundError(
-            f"File {filename} not found in {file_path.parent}"
+            f"File {filename} not found in {_FILES_DIR}"
         )
 
     return str(file_path)
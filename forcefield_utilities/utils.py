@@ -1,27 +1,34 @@
 import functools
+import sys
 import warnings
 
 
+def intern_attribs(attrib):
+    """Copy an XML attribute mapping, interning its highly repetitive keys."""
+    return {sys.intern(key): value for key, value in attrib.items()}
+
+
 def call_on_import(func):
     """Declare a decorator that will run `func` when imported."""
     func()
 
 
+@functools.lru_cache(maxsize=None)
 def get_package_file_path(from_package, relative_path):
     """Use source of a python package to locate and cache the address of a file."""
-    from pkg_resources import resource_filename
+    from importlib.resources import files
 
-    return resource_filename(from_package, relative_path)
+    return str(files(from_package).joinpath(relative_path))
 
 
 def deprecate_kwargs(deprecated_kwargs=None):
-    if deprecated_kwargs is None:
-        deprecated_kwargs = set()
+    deprecated_kwargs = frozenset(deprecated_kwargs or ())
 
     def decorate_deprecate_kwargs(func):
         @functools.wraps(func)
         def wrapper(self_or_cls, *args, **kwargs):
-            _deprecate_kwargs(kwargs, deprecated_kwargs)
+            if kwargs and deprecated_kwargs:
+                _deprecate_kwargs(kwargs, deprecated_kwargs)
             return func(self_or_cls, *args, **kwargs)
 
         return wrapper
@@ -30,43 +37,76 @@ def deprecate_kwargs(deprecated_kwargs=None):
 
 
 def _deprecate_kwargs(kwargs, deprecated_kwargs):
-    added_args = []
-    for kwarg in kwargs:
-        if kwarg in deprecated_kwargs:
-            added_args.append(kwarg)
+    added_args = list(kwargs.keys() & deprecated_kwargs)
+    if not added_args:
+        return
+    joined = ", ".join(added_args)
     if len(added_args) > 1:
         message = (
-            "Keyword arguments `{dep_args}` are deprecated and will be removed in the "
+            f"Keyword arguments `{joined}` are deprecated and will be removed in the "
             "next minor release of the package. Please update your code accordingly"
         )
     else:
         message = (
-            "Keyword argument `{dep_args}` is deprecated and will be removed in the "
+            f"Keyword argument `{joined}` is deprecated and will be removed in the "
             "next minor release of the package. Please update your code accordingly"
         )
-    if added_args:
-        warnings.warn(
-            message.format(dep_args=", ".join(added_args)),
-            DeprecationWarning,
-            3,
-        )
+    warnings.warn(message, DeprecationWarning, 3)
 
 
-def pad_with_wildcards(input_dictionary, max_len, wildcard="*"):
-    """Pad empty type or classes with wildcards"""
-    types = [f"type{j+1}" for j in range(max_len)]
-    classes = [f"class{j+1}" for j in range(max_len)]
+@functools.lru_cache(maxsize=None)
+def _membership_keys(max_len):
+    """Return the typeN and classN key names for a member count."""
+    return (
+        tuple(f"type{j+1}" for j in range(max_len)),
+        tuple(f"class{j+1}" for j in range(max_len)),
+    )
 
-    if types[0] in input_dictionary:
-        for type_ in types:
-            value = input_dictionary[type_]
-            if isinstance(value, str) and value.strip() == "":
-                input_dictionary[type_] = wildcard
 
+def pad_and_key(input_dictionary, max_len, wildcard="*"):
+    """Pad empty members with wildcards and build the identifier tuple.
+
+    Walks the typeN or classN entries of ``input_dictionary`` once,
+    replacing blank values with the wildcard in place, and returns the
+    mapping together with the tuple of member tokens used to register
+    the entry. When neither family of keys is present the identifier is
+    a tuple of ``None`` entries, matching the unset model fields.
+    """
+    types, classes = _membership_keys(max_len)
+
+    if types[0] in input_dictionary:
+        keys = types
     elif classes[0] in input_dictionary:
-        for class_ in classes:
-            value = input_dictionary[class_]
-            if isinstance(value, str) and value.strip() == "":
-                input_dictionary[class_] = wildcard
+        keys = classes
+    else:
+        return input_dictionary, (None,) * max_len
+
+    identifier = []
+    for key in keys:
+        value = input_dictionary[key]
+        if isinstance(value, str):
+            if not value or value.isspace():
+                value = wildcard
+            # Member tokens repeat across thousands of rows; interning
+            # them makes the later identifier and key hashing cheap.
+            value = sys.intern(value)
+            input_dictionary[key] = value
+        identifier.append(value)
+
+    return input_dictionary, tuple(identifier)
+
+
+_MEMBER_PREFIXES = ("type", "class")
+
+
+def pad_with_wildcards(input_dictionary, max_len, wildcard="*"):
+    """Pad empty type or classes with wildcards"""
+    for key, value in input_dictionary.items():
+        if (
+            isinstance(value, str)
+            and (not value or value.isspace())
+            and key.startswith(_MEMBER_PREFIXES)
+        ):
+            input_dictionary[key] = wildcard
 
     return input_dictionary
@@ -1,4 +1,10 @@
 import abc
+import functools
+import hashlib
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union
 
@@ -8,20 +14,152 @@ from lxml import etree
 from forcefield_utilities.foyer_xml import ForceField as FoyerForceField
 from forcefield_utilities.gmso_xml import ForceField as GMSOForceField
 from forcefield_utilities.utils import (
-    call_on_import,
     deprecate_kwargs,
     get_package_file_path,
 )
 
 custom_forcefields = {}
 
+# Bumped whenever a custom forcefield name is overwritten. Cache
+# entries record the generation they were loaded under, so a stale
+# entry fails a single integer compare instead of being tracked in a
+# separate invalidation set.
+_custom_generations = {}
+
+# Parsed forcefields shared across loader instances, keyed by
+# (loader class, cache key). Lets downstream code that rebuilds
+# loaders reuse parses without going back to disk.
+_GLOBAL_FF_CACHE = {}
+
+# Serializes cache mutation; lookups on the hit path stay lock-free
+# because dict reads are atomic under the GIL.
+_LOAD_LOCK = threading.Lock()
+
+_PARSER_LOCAL = threading.local()
+
+
+def _thread_parser() -> etree.XMLParser:
+    """Return this thread's XML parser, creating it on first use.
+
+    libxml2 parser state is not thread-safe, and load_many parses on a
+    thread pool, so each thread gets its own parser tuned for this
+    pipeline: no xml:id table, no blank-text nodes, and no tree-size
+    ceiling for very large forcefields.
+    """
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(
+            collect_ids=False,
+            remove_blank_text=True,
+            remove_comments=True,
+            huge_tree=True,
+            resolve_entities=False,
+        )
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_foyer(path_str, mtime_ns):
+    """Parse a foyer XML once per (path, mtime) across loader instances."""
+    return FoyerForceField.stream_load(path_str)
+
+
+@functools.lru_cache(maxsize=1)
+def _gmso_schema():
+    """Compile gmso's forcefield schema once for reuse across loads.
+
+    Returns ``None`` when the packaged schema cannot be located, in
+    which case validation falls back to gmso's own helper.
+    """
+    try:
+        schema_path = get_package_file_path(
+            "gmso", "utils/schema/ff-gmso.xsd"
+        )
+        return etree.XMLSchema(etree.parse(schema_path))
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_gmso(path_str, mtime_ns):
+    """Parse and validate a gmso XML once per (path, mtime)."""
+    # One bulk read hands libxml2 a single contiguous buffer instead
+    # of chunked reads through a Python file object.
+    with open(path_str, "rb") as ff_file:
+        data = ff_file.read()
+    root = etree.fromstring(data, _thread_parser())
+    ff_etree = root.getroottree()
+    schema = _gmso_schema()
+    if schema is None:
+        validate_gmso_schema(ff_etree)
+    else:
+        try:
+            schema.assertValid(ff_etree)
+        except etree.DocumentInvalid:
+            # Re-run upstream validation so callers see gmso's own
+            # error type and message for invalid documents.
+            validate_gmso_schema(ff_etree)
+            raise
+    ff = GMSOForceField.load_from_etree(root)
+    # The pydantic model holds everything we need; free the DOM before
+    # the forcefield is retained in the caches.
+    root.clear()
+    return ff
+
+
+@functools.lru_cache(maxsize=1)
+def _shipped_foyer_xmls():
+    """Map the stems of foyer's shipped XMLs to their file paths.
+
+    The set of shipped forcefields is small and fixed for the life of
+    the process, so one directory enumeration replaces a per-name
+    importlib.resources lookup. Returns an empty mapping when foyer is
+    not importable or lacks the directory.
+    """
+    from importlib.resources import files
+
+    try:
+        xml_dir = files("foyer").joinpath("forcefields/xml")
+        return {
+            os.path.splitext(entry.name)[0]: str(entry)
+            for entry in xml_dir.iterdir()
+            if entry.name.endswith(".xml")
+        }
+    except Exception:
+        return {}
+
+
+def _disk_cache_dir() -> Path:
+    """Return the directory used for on-disk forcefield pickles."""
+    return Path(
+        os.environ.get(
+            "FFUTILS_CACHE_DIR",
+            Path.home() / ".cache" / "forcefield-utilities",
+        )
+    )
+
+
+def _disk_cache_key(xml_path) -> str:
+    """Build a cache key from the file identity and library versions."""
+    import gmso
+
+    from forcefield_utilities import __version__
+
+    stat = os.stat(xml_path)
+    tag = (
+        f"{os.path.abspath(xml_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+        f"|{__version__}|{gmso.__version__}"
+    )
+    return hashlib.blake2b(tag.encode()).hexdigest()
+
 
 class XMLLoader:
     """Object to provide methods to forcefields shipped with Foyer/GMSO.
 
     Attributes
     __________
-    loaded_ffs : dict, keys are strings, values are the loaded forcefield
+    loaded_ffs : dict, keys are strings, values are (generation, forcefield)
         This is a place to store loaded xmls, which can be accessed through
         the getter by indexing the object. xmls are only stored once,
         and custom_xml is where a forcefield is stored from path. Note: This is a
@@ -45,9 +183,18 @@ class XMLLoader:
     `clear_loaded_ffs` can be used to clear the cache.
     """
 
+    __slots__ = ()
+
     loaded_ffs = None
-    overwritten_custom_ffs = None
     search_foyer = False
+    _singleton = None
+
+    @classmethod
+    def _get_singleton(cls):
+        """Return the shared loader instance for this class."""
+        if cls.__dict__.get("_singleton") is None:
+            cls._singleton = cls()
+        return cls._singleton
 
     @abc.abstractmethod
     def load_xml(self, xml_path) -> Union[FoyerForceField, GMSOForceField]:
@@ -71,8 +218,11 @@ class XMLLoader:
         _______
         ff : forcefield_utilities.foyer_xml.Forcefield
         """
-        loader = cls()
-        return loader.load(ffname)
+        if isinstance(ffname, str):
+            return _cached_get_ff(
+                cls, ffname, _custom_generations.get(ffname, 0)
+            )
+        return cls._get_singleton().load(ffname)
 
     @deprecate_kwargs(deprecated_kwargs={"rel_to_module"})
     def load(
@@ -111,49 +261,185 @@ class XMLLoader:
         This method caches the loaded forcefields by name, please use the clear_cache method
         if you changed the forcefield XML file. This might be especially relavent when using from a jupyter notebook.
         """
-        if (
-            ffname in self.loaded_ffs
-            and ffname not in self.overwritten_custom_ffs
-        ):
-            return self.loaded_ffs[ffname]
+        cached, custom_path = self._lookup(ffname)
+        if cached is not None:
+            return cached
+
+        with _LOAD_LOCK:
+            # Another thread may have finished this load while we
+            # waited for the lock.
+            cached, custom_path = self._lookup(ffname)
+            if cached is not None:
+                return cached
+
+            if (
+                custom_path is None
+                and self.search_foyer
+                and ffname == "gaff"
+            ):
+                # GAFF registration is deferred to first use so imports
+                # stay cheap; see register_gaff.
+                register_gaff()
+                custom_path = custom_forcefields.get("gaff")
+
+            name = os.fspath(ffname)
+            generation = _custom_generations.get(ffname, 0)
+
+            if custom_path is not None:
+                entry = (generation, self.load_cached(custom_path))
+                self.loaded_ffs[ffname] = entry
+                _GLOBAL_FF_CACHE[(type(self), ffname)] = entry
+                return entry[1]
+
+            stem = os.path.splitext(os.path.basename(name))[0]
+            if name.endswith(".xml"):
+                entry = (generation, self.load_cached(os.path.abspath(name)))
+            elif self.search_foyer:
+                xml_path = _shipped_foyer_xmls().get(stem)
+                if xml_path is None:
+                    xml_path = get_package_file_path(
+                        "foyer", f"forcefields/xml/{ffname}.xml"
+                    )
+                entry = (generation, self.load_cached(xml_path))
+            else:
+                raise FileNotFoundError(
+                    f"{ffname} not found, it isn't registered forcefiled name or a XML file."
+                )
+
+            self.loaded_ffs[stem] = entry
+            _GLOBAL_FF_CACHE[(type(self), stem)] = entry
+            return entry[1]
+
+    def _lookup(self, ffname):
+        """Probe the caches and the custom registry in one pass.
+
+        Returns ``(cached forcefield or None, custom XML path or None)``
+        so ``load`` pays one dict probe per source instead of separate
+        membership tests. An entry whose recorded generation trails the
+        current one (the name was overwritten since it was loaded) is
+        treated as a miss.
+        """
+        generation = _custom_generations.get(ffname, 0)
+        entry = self.loaded_ffs.get(ffname)
+        if entry is None:
+            entry = _GLOBAL_FF_CACHE.get((type(self), ffname))
+            if entry is not None and entry[0] == generation:
+                self.loaded_ffs[ffname] = entry
+        if entry is not None and entry[0] == generation:
+            return entry[1], None
+        return None, custom_forcefields.get(ffname)
+
+    def _resolve(self, ffname):
+        """Resolve a forcefield name or path to (cache key, XML path)."""
+        if ffname in custom_forcefields:
+            return ffname, custom_forcefields[ffname]
+        name = os.fspath(ffname)
+        stem = os.path.splitext(os.path.basename(name))[0]
+        if name.endswith(".xml"):
+            # abspath is a pure string operation; resolve() would walk
+            # the symlink chain with one syscall per component.
+            return stem, os.path.abspath(name)
+        if self.search_foyer:
+            xml_path = _shipped_foyer_xmls().get(stem)
+            if xml_path is None:
+                xml_path = get_package_file_path(
+                    "foyer", f"forcefields/xml/{ffname}.xml"
+                )
+            return stem, xml_path
+        raise FileNotFoundError(
+            f"{ffname} not found, it isn't registered forcefiled name or a XML file."
+        )
+
+    def load_many(self, names):
+        """Load several forcefields, parsing the missing ones in parallel.
+
+        libxml2 releases the GIL while parsing, so cold loads of
+        independent files overlap on a thread pool. Already-cached
+        names are returned as-is.
 
-        ff_path = Path(ffname)
+        Parameters
+        ----------
+        names : iterable of str or pathlib.Path
+            Forcefield names or XML paths, as accepted by ``load``.
 
-        if ffname in custom_forcefields:
-            self.loaded_ffs[ffname] = self.load_xml(
-                xml_path=custom_forcefields[ffname]
-            )
-            self.overwritten_custom_ffs.discard(ffname)
-            return self.loaded_ffs[ff_path.name]
+        Returns
+        -------
+        list of parsed forcefields, in the order of ``names``.
+        """
+        names = list(names)
+        resolved = [
+            (self._resolve(name), name)
+            for name in names
+            if self._lookup(name)[0] is None
+        ]
+        if resolved:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(resolved))
+            ) as executor:
+                parsed = executor.map(
+                    self.load_cached, (path for (_, path), _ in resolved)
+                )
+                with _LOAD_LOCK:
+                    for ((key, _), _), ff in zip(resolved, parsed):
+                        self.loaded_ffs[key] = (
+                            _custom_generations.get(key, 0),
+                            ff,
+                        )
+        return [self.load(name) for name in names]
+
+    def load_cached(
+        self, xml_path: Union[str, Path]
+    ) -> Union[FoyerForceField, GMSOForceField]:
+        """Load a forcefield XML, reusing an on-disk pickle when unchanged.
 
-        if self._is_xml(ff_path):
-            self.loaded_ffs[ff_path.stem] = self.load_xml(
-                xml_path=ff_path.resolve()
-            )
-        elif self.search_foyer:
-            xml_path = get_package_file_path(
-                "foyer", f"forcefields/xml/{ffname}.xml"
-            )
-            self.loaded_ffs[ff_path.stem] = self.load_xml(xml_path)
-        else:
-            raise FileNotFoundError(
-                f"{ffname} not found, it isn't registered forcefiled name or a XML file."
+        The parsed forcefield is pickled under ``~/.cache/forcefield-utilities``
+        (overridable via the ``FFUTILS_CACHE_DIR`` environment variable), keyed
+        by the file path, its mtime and size, and the library versions, so a
+        modified XML or a version bump transparently invalidates the cache.
+        """
+        cache_file = _disk_cache_dir() / f"{_disk_cache_key(xml_path)}.pkl"
+        if cache_file.exists():
+            try:
+                # Pickles run to megabytes; a 64 KiB buffer cuts the
+                # read syscalls by 8x over the interpreter default.
+                with open(cache_file, "rb", buffering=65536) as cached:
+                    return pickle.load(cached)
+            except Exception:
+                pass
+
+        ff = self.load_xml(xml_path)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename keeps concurrent readers from ever
+            # seeing a half-written pickle. The temp name carries the
+            # thread id as well as the pid because load_many dumps
+            # from a thread pool.
+            tmp_file = cache_file.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
             )
-
-        return self.loaded_ffs[ff_path.stem]
+            with open(tmp_file, "wb") as cached:
+                pickle.dump(ff, cached, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception:
+            pass
+        return ff
 
     def __getitem__(self, ffname) -> Union[FoyerForceField, GMSOForceField]:
         """Get function for indexing by loaded forcefields."""
-        return self.loaded_ffs[ffname]
+        return self.loaded_ffs[ffname][1]
 
     def __getattr__(self, item) -> Union[FoyerForceField, GMSOForceField]:
         """Accessor for loaded forcefields."""
-        if item in self.loaded_ffs:
-            return self.loaded_ffs[item]
-        else:
-            raise AttributeError(
-                f"{self.__class__.__name__} has no attribute {item}"
-            )
+        # Dunder probes (copy, pickle, ipython display) must fail fast
+        # without touching loaded_ffs, which may itself be unset while
+        # unpickling.
+        if item.startswith("__"):
+            raise AttributeError(item)
+        ffs = type(self).loaded_ffs or {}
+        try:
+            return ffs[item][1]
+        except KeyError:
+            raise AttributeError(item) from None
 
     def register_custom_forcefield(
         self, name: str, path_: Union[str, Path], overwrite: bool = True
@@ -167,64 +453,111 @@ class XMLLoader:
         path_: str, Path
             The XML path for the forcefield XML file
         """
-        if not overwrite and name in custom_forcefields:
-            raise ValueError(
-                f"Forcefield {name} is already registered to point to "
-                f"{custom_forcefields[name]}. Please use overwrite=True "
-                f"if you wish to overwrite it."
-            )
-        if overwrite and name in custom_forcefields:
-            self.overwritten_custom_ffs.add(name)
-
-        custom_forcefields[name] = str(path_)
+        with _LOAD_LOCK:
+            if not overwrite and name in custom_forcefields:
+                raise ValueError(
+                    f"Forcefield {name} is already registered to point to "
+                    f"{custom_forcefields[name]}. Please use overwrite=True "
+                    f"if you wish to overwrite it."
+                )
+            if overwrite and name in custom_forcefields:
+                _custom_generations[name] = (
+                    _custom_generations.get(name, 0) + 1
+                )
+                _parse_foyer.cache_clear()
+                _parse_gmso.cache_clear()
+
+            custom_forcefields[name] = str(path_)
 
     def clear_cache(self):
-        self.loaded_ffs = {}
-        self.overwritten_custom_ffs = set()
+        with _LOAD_LOCK:
+            type(self).loaded_ffs = {}
+            _cached_get_ff.cache_clear()
+            _parse_foyer.cache_clear()
+            _parse_gmso.cache_clear()
+            cls = type(self)
+            for key in [k for k in _GLOBAL_FF_CACHE if k[0] is cls]:
+                del _GLOBAL_FF_CACHE[key]
+
+    @classmethod
+    def clear_global_cache(cls):
+        """Drop the parsed forcefields shared across loader instances."""
+        _GLOBAL_FF_CACHE.clear()
+
+    @classmethod
+    def clear_disk_cache(cls):
+        """Remove all pickled forcefields from the on-disk cache."""
+        cache_dir = _disk_cache_dir()
+        if not cache_dir.is_dir():
+            return
+        for cached in cache_dir.glob("*.pkl"):
+            try:
+                cached.unlink()
+            except OSError:
+                pass
 
     @staticmethod
-    def _is_xml(path_: Path) -> bool:
+    def _is_xml(path_: Union[str, Path]) -> bool:
+        # Strings take the cheap endswith branch; Path objects keep the
+        # suffix check without a new allocation.
+        if isinstance(path_, str):
+            return path_.endswith(".xml")
         return path_.suffix == ".xml"
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_get_ff(cls, ffname, generation):
+    """Memoize get_ff per loader class, forcefield name and generation.
+
+    The generation is part of the key so overwriting a custom
+    forcefield naturally invalidates the memo entry, matching the
+    generation check load itself performs.
+    """
+    return cls._get_singleton().load(ffname)
+
+
 class FoyerFFs(XMLLoader):
     """Utility class to load foyer forcefields."""
 
+    __slots__ = ()
+
     loaded_ffs = {}
-    overwritten_custom_ffs = set()
     search_foyer = True
 
     def load_xml(self, xml_path):
         """Return the foyer Forcefield object from the relative path ``xml_path`` inside the foyer package."""
-        with open(xml_path) as ff_file:
-            root = etree.parse(ff_file).getroot()
-            return FoyerForceField.load_from_etree(root)
+        stat = os.stat(xml_path)
+        return _parse_foyer(str(xml_path), stat.st_mtime_ns)
 
 
 class GMSOFFs(XMLLoader):
     """Utility class to load gmso forcefields."""
 
+    __slots__ = ()
+
     loaded_ffs = {}
-    overwritten_custom_ffs = set()
     search_foyer = False
 
     def load_xml(self, xml_path):
         """Return the gmso Forcefield object from the relative path ``xml_path`` for a gmso XML."""
-        with open(xml_path) as ff_file:
-            ff_etree = etree.parse(ff_file)
-            validate_gmso_schema(ff_etree)
-            root = ff_etree.getroot()
-            return GMSOForceField.load_from_etree(root)
+        stat = os.stat(xml_path)
+        return _parse_gmso(str(xml_path), stat.st_mtime_ns)
 
 
-@call_on_import
 def register_gaff():
-    """Include GAFF as part of FoyerFFs if antefoyer is installed locally."""
-    try:
-        import importlib
+    """Register antefoyer's GAFF XML, if antefoyer is installed locally.
+
+    Runs on the first request for "gaff" rather than at import, so
+    importing forcefield_utilities never pays for locating antefoyer's
+    data files. Idempotent; a no-op when antefoyer is absent or the
+    name is already registered.
+    """
+    if "gaff" in custom_forcefields:
+        return
+    from importlib.util import find_spec
 
-        importlib.import_module("antefoyer")
-    except ImportError:
+    # find_spec only locates the package without executing it.
+    if find_spec("antefoyer") is None:
         return
     custom_forcefields["gaff"] = get_package_file_path(
         "antefoyer", "xml/gaff.xml"
@@ -1,4 +1,4 @@
-from setuptools import find_packages, setup
+from setuptools import setup
 
 setup(
     name="forcefield_utilities",
@@ -8,7 +8,10 @@ setup(
     author_email="umesh.timalsina@vanderbilt.edu",
     install_requires=["foyer", "gmso"],
     license="MIT",
-    packages=find_packages(),
+    packages=[
+        "forcefield_utilities",
+        "forcefield_utilities.tests",
+    ],
     zip_safe=True,
     include_package_data=True,
 )